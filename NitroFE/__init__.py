@@ -20,4 +20,5 @@ from NitroFE.encoding.encoding_features import SmoothedEncoding,CategoricalEncod
 from NitroFE.time_based_features.weighted_window_features.weighted_window_features import weighted_window_features
 
 from NitroFE.time_based_features.moving_average_features.moving_average_features import ExponentialMovingFeature,HullMovingFeature,\
-    KaufmanAdaptiveMovingAverage,FractalAdaptiveMovingAverage,TripleExponentialMovingFeature,SmoothedMovingAverage
\ No newline at end of file
+    KaufmanAdaptiveMovingAverage,FractalAdaptiveMovingAverage,TripleExponentialMovingFeature,SmoothedMovingAverage,\
+    ExponentialMovingFeatureBank
\ No newline at end of file
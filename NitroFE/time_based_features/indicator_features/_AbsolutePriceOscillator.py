@@ -5,6 +5,11 @@ from typing import Union, Callable
 from pandas.core.frame import DataFrame
 from NitroFE.time_based_features.moving_average_features.moving_average_features import (
     ExponentialMovingFeature,
+    ExponentialMovingFeatureBank,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _float_values,
+    _frame_like,
 )
 
 
@@ -80,6 +85,19 @@ class AbsolutePriceOscillator:
         """
 
         if first_fit:
+            # both averages run over the same input, as one bank when the ewm paths allow it
+            self._banked = (
+                (not self.initialize_using_operation)
+                and (self.initialize_span is None)
+                and (self.times is None)
+                and (self.axis == 0)
+                and (_float_values(dataframe) is not None)
+            )
+            self._em_bank = ExponentialMovingFeatureBank(
+                spans=[self.span_fast, self.span_slow],
+                operation=self.fast_operation,
+                ignore_na=self.ignore_na,
+            )
             self._fast_em_object = ExponentialMovingFeature(
                 span=self.span_fast,
                 initialize_using_operation=self.initialize_using_operation,
@@ -99,8 +117,15 @@ class AbsolutePriceOscillator:
                 operation=self.fast_operation,
             )
 
-        fast_em = self._fast_em_object.fit(dataframe=dataframe, first_fit=first_fit)
-        slow_em = self._slow_em_object.fit(dataframe=dataframe, first_fit=first_fit)
+        if self._banked:
+            _averages = self._em_bank._fit_values(
+                dataframe=dataframe, first_fit=first_fit
+            )
+            fast_em = _frame_like(_averages[:, :, 0], dataframe)
+            slow_em = _frame_like(_averages[:, :, 1], dataframe)
+        else:
+            fast_em = self._fast_em_object.fit(dataframe=dataframe, first_fit=first_fit)
+            slow_em = self._slow_em_object.fit(dataframe=dataframe, first_fit=first_fit)
 
         absolute_price_oscillator = slow_em - fast_em
         return absolute_price_oscillator
@@ -1,13 +1,13 @@
 import numpy as np
 import pandas as pd
 from typing import Union, Callable
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
-)
 
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _RingBuffer,
+    _rolling_count,
+    _rolling_extrema,
+    _validate_fit,
 )
 
 
@@ -28,12 +28,6 @@ class AroonOscillator:
         self.lookback_period = lookback_period
         self.min_periods = min_periods
 
-    def _calculate_aroon_up(self, x, look_back_period):
-        return x.argmax() / (look_back_period)
-
-    def _calculate_aroon_down(self, x, look_back_period):
-        return x.argmin() / (look_back_period)
-
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
         For your training/initial fit phase (very first fit) use fit_first=True, and for any production/test implementation pass fit_first=False
@@ -49,32 +43,36 @@ class AroonOscillator:
             were saved during the last phase, will be utilized for calculation }, by default True
         """
 
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[(self.lookback_period, self.min_periods)],
+        )
         if first_fit:
-            self._aroon_up_object = weighted_window_features()
-            self._aroon_down_object = weighted_window_features()
+            self._last_values = _RingBuffer(
+                self.lookback_period - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
+            )
+
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _all_values = np.concatenate((self._last_values.values(), _values))
+        _first_row = len(self._last_values)
+        self._last_values.extend(_values)
 
-        aroon_up = self._aroon_up_object._template_feature_calculation(
-            function_name="aroon_up",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=self.lookback_period,
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._calculate_aroon_up,
-            operation_args=(self.lookback_period,),
+        # positions of the highest and lowest values from the start of each window
+        _, _, _argmax, _argmin = _rolling_extrema(
+            _all_values, self.lookback_period, _first_row
+        )
+        aroon_value = 100 * (
+            _argmax / self.lookback_period - _argmin / self.lookback_period
         )
-        aroon_down = self._aroon_up_object._template_feature_calculation(
-            function_name="aroon_down",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=self.lookback_period,
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._calculate_aroon_down,
-            operation_args=(self.lookback_period,),
+        _min_periods = (
+            self.lookback_period if self.min_periods is None else self.min_periods
         )
-        aroon_value = 100 * (aroon_up - aroon_down)
+        aroon_value[
+            _rolling_count(_all_values, self.lookback_period)[_first_row:]
+            < _min_periods
+        ] = np.nan
 
-        return aroon_value
+        return _frame_like(aroon_value, dataframe)
@@ -6,15 +6,14 @@ from pandas.core.frame import DataFrame
 from NitroFE.time_based_features.indicator_features._AverageTrueRange import (
     AverageTrueRange,
 )
-from NitroFE.time_based_features.moving_average_features.moving_average_features import (
-    ExponentialMovingFeature,
+from NitroFE.time_based_features.moving_average_features.moving_average_kernels import (
+    _exponential_moving_average,
 )
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
-)
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _RingBuffer,
+    _rolling_count,
+    _rolling_extrema,
+    _validate_fit,
 )
 
 
@@ -77,17 +76,51 @@ class AverageDirectionalMovementIndex:
         self.true_range_min_periods = true_range_min_periods
         self.average_true_range_periods = average_true_range_periods
 
-    def _plus_dm(self, x, look_back_period):
-        look_back_period = int(look_back_period / 2)
-        return np.max(x.iloc[look_back_period:]) - np.max(
-            x.iloc[0 : look_back_period - 1]
-        )
+    def _directional_movements(self, values: np.ndarray, first_row: int):
+        """
+        +DM and -DM of rows from first_row, over windows of the last
+        min(i+1, 2 * directional_movement_lookback_period) values. The movement compares the
+        extrema of the window from its half = int(lookback_period / 2) row onwards with those
+        of its first half - 1 rows. Earlier rows only serve as history.
+        """
+        _window = 2 * self.directional_movement_lookback_period
+        _half = int(self.directional_movement_lookback_period / 2)
+        _rows = np.arange(first_row, len(values))
+        _starts = np.maximum(_rows - _window + 1, 0)
+
+        # recent part, rows [start + half, i] : the first half rows never enter a window
+        _masked = values.copy()
+        _masked[:_half] = np.nan
+        _recent_max, _recent_min, _, _ = _rolling_extrema(
+            _masked, _window - _half, first_row
+        )
+
+        # older part, rows [start, start + half - 2], or all but the last row for half = 0
+        _older_length = _half - 1 if _half >= 1 else _window - 1
+        _older_max = np.full(_recent_max.shape, np.nan)
+        _older_min = np.full(_recent_min.shape, np.nan)
+        if _older_length > 0:
+            _ends = np.minimum(
+                _starts + _older_length - 1, _rows - 1 if _half == 0 else _rows
+            )
+            _valid = _ends >= _starts
+            _first = _ends[_valid].min(initial=len(values))
+            _maxima, _minima, _, _ = _rolling_extrema(values, _older_length, _first)
+            _older_max[_valid] = _maxima[_ends[_valid] - _first]
+            _older_min[_valid] = _minima[_ends[_valid] - _first]
+
+        _plus_dm = _recent_max - _older_max
+        _minus_dm = _older_min - _recent_min
 
-    def _minus_dm(self, x, look_back_period):
-        look_back_period = int(look_back_period / 2)
-        return np.min(x.iloc[0 : look_back_period - 1]) - np.min(
-            x.iloc[look_back_period:]
+        _min_periods = (
+            _window
+            if self.directional_movement_min_periods is None
+            else self.directional_movement_min_periods
         )
+        _few = _rolling_count(values, _window)[first_row:] < _min_periods
+        _plus_dm[_few] = np.nan
+        _minus_dm[_few] = np.nan
+        return _plus_dm, _minus_dm
 
     def fit(
         self,
@@ -107,21 +140,34 @@ class AverageDirectionalMovementIndex:
             Use False, when calculating for subsequent testing/production data { in which case the values, which
             were saved during the last phase, will be utilized for calculation }, by default True
         """
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[
+                (
+                    2 * self.directional_movement_lookback_period,
+                    self.directional_movement_min_periods,
+                )
+            ],
+            ewm=[
+                dict(
+                    alpha=1 / (self.directional_movement_smoothing_period),
+                    min_periods=self.directional_movement_smoothing_min_periods,
+                ),
+                dict(
+                    alpha=1 / (self.average_directional_movement_smoothing_period),
+                    min_periods=self.average_directional_movement_min_periods,
+                ),
+            ],
+        )
         if first_fit:
-
-            self._plus_dma_object = weighted_window_features()
-            self._minus_dma_object = weighted_window_features()
-
-            self._plus_dm_smoothing_object = ExponentialMovingFeature(
-                alpha=1 / (self.directional_movement_smoothing_period),
-                min_periods=self.directional_movement_smoothing_min_periods,
-                operation="mean",
-            )
-            self._minus_dm_smoothing_object = ExponentialMovingFeature(
-                alpha=1 / (self.directional_movement_smoothing_period),
-                min_periods=self.directional_movement_smoothing_min_periods,
-                operation="mean",
+            self._last_values = _RingBuffer(
+                2 * self.directional_movement_lookback_period - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
             )
+            self._directional_movement_state = None
+            self._average_directional_movement_state = None
 
             self._average_true_range_object = AverageTrueRange(
                 true_range_lookback=self.true_range_lookback,
@@ -130,81 +176,71 @@ class AverageDirectionalMovementIndex:
                 average_true_range_periods=self.average_true_range_periods,
             )
 
-            self._average_dm_smoothing_object = ExponentialMovingFeature(
-                alpha=1 / (self.average_directional_movement_smoothing_period),
-                min_periods=self.average_directional_movement_min_periods,
-                operation="mean",
-            )
-
-        plus_dma = self._plus_dma_object._template_feature_calculation(
-            function_name="plus_dma",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=2 * self.directional_movement_lookback_period,
-            min_periods=self.directional_movement_min_periods,
-            symmetric=None,
-            operation=self._plus_dm,
-            operation_args=(self.directional_movement_lookback_period),
-        )
-        minus_dma = self._minus_dma_object._template_feature_calculation(
-            function_name="minus_dma",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=2 * self.directional_movement_lookback_period,
-            min_periods=self.directional_movement_min_periods,
-            symmetric=None,
-            operation=self._minus_dm,
-            operation_args=(self.directional_movement_lookback_period),
-        )
-
-        names = (
-            plus_dma.columns if isinstance(plus_dma, pd.DataFrame) else [plus_dma.name]
-        )
-
-        frame_index = plus_dma.index
-        plus_dma_frame = pd.DataFrame(
-            np.where(((plus_dma > minus_dma) & plus_dma > 0), plus_dma, 0),
-            columns=names,
-            index=frame_index.values,
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _plus_dm, _minus_dm = self._directional_movements(
+            np.concatenate((self._last_values.values(), _values)),
+            len(self._last_values),
         )
+        self._last_values.extend(_values)
 
-        minus_dma_frame = pd.DataFrame(
-            np.where(((minus_dma > plus_dma) & minus_dma > 0), minus_dma, 0),
-            columns=names,
-            index=frame_index.values,
+        # +DM and -DM side by side, only the larger movement of each row is kept
+        n_rows, n_cols = _values.shape
+        _directional = np.empty((n_rows, 2 * n_cols))
+        np.copyto(_directional[:, :n_cols], np.where(_plus_dm > _minus_dm, _plus_dm, 0))
+        np.copyto(
+            _directional[:, n_cols:], np.where(_minus_dm > _plus_dm, _minus_dm, 0)
         )
 
-        smoothed_plus_dma = self._plus_dm_smoothing_object.fit(
-            dataframe=plus_dma_frame, first_fit=first_fit
-        )
-
-        smoothed_minus_dma = self._minus_dm_smoothing_object.fit(
-            dataframe=minus_dma_frame,
-            first_fit=first_fit,
+        # both Wilder smoothings run as one recursive filter over the 2 * n_cols channels
+        (
+            _directional,
+            self._directional_movement_state,
+        ) = _exponential_moving_average(
+            _directional,
+            alpha=1 / (self.directional_movement_smoothing_period),
+            min_periods=(
+                0
+                if self.directional_movement_smoothing_min_periods is None
+                else self.directional_movement_smoothing_min_periods
+            ),
+            state=self._directional_movement_state,
         )
 
         average_true_range = self._average_true_range_object.fit(
             dataframe=dataframe,
             first_fit=first_fit,
         )
-        average_true_range = (
-            average_true_range.to_frame()
-            if isinstance(average_true_range, pd.Series)
-            else average_true_range
+        _average_true_range = average_true_range.to_numpy(dtype=float).reshape(
+            n_rows, -1
         )
 
-        plus_directional_index = 100 * (smoothed_plus_dma.div(average_true_range))
-        minus_directional_index = 100 * (smoothed_minus_dma.div(average_true_range))
-
-        temp_adx = np.abs(
-            (plus_directional_index - minus_directional_index)
-            / (plus_directional_index + minus_directional_index)
-        )
+        # +DI and -DI, in place
+        _directional_index = _directional.reshape(n_rows, 2, n_cols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _directional_index /= _average_true_range[:, None, :]
+            _directional_index *= 100
+            temp_adx = np.abs(
+                (_directional_index[:, 0] - _directional_index[:, 1])
+                / (_directional_index[:, 0] + _directional_index[:, 1])
+            )
 
-        adx = self._average_dm_smoothing_object.fit(
-            dataframe=temp_adx,
-            first_fit=first_fit,
+        adx, self._average_directional_movement_state = _exponential_moving_average(
+            temp_adx,
+            alpha=1 / (self.average_directional_movement_smoothing_period),
+            min_periods=(
+                0
+                if self.average_directional_movement_min_periods is None
+                else self.average_directional_movement_min_periods
+            ),
+            state=self._average_directional_movement_state,
+        )
+
+        return pd.DataFrame(
+            adx,
+            index=dataframe.index,
+            columns=(
+                dataframe.columns
+                if isinstance(dataframe, pd.DataFrame)
+                else [dataframe.name]
+            ),
         )
-        return adx
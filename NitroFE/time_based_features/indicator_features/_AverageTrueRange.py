@@ -2,12 +2,13 @@ import numpy as np
 import pandas as pd
 from typing import Union, Callable
 
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
-)
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _RingBuffer,
+    _rolling_count,
+    _rolling_extrema,
+    _rolling_mean,
+    _validate_fit,
 )
 
 
@@ -42,15 +43,30 @@ class AverageTrueRange:
         self.average_true_range_periods = average_true_range_periods
         self.return_true_range = return_true_range
 
-    def true_range(self, x):
-        return np.max(
-            [
-                (np.max(x) - np.min(x)),
-                np.abs(np.max(x) - x.iloc[-1]),
-                np.abs(np.min(x) - x.iloc[-1]),
-            ]
+    def _true_range(self, values: np.ndarray, first_row: int):
+        """
+        True range of rows from first_row, the rolling range of the last min(i+1, true_range_lookback)
+        values and the distances of the current value to its extrema. Earlier rows only serve as history.
+        """
+        _maxima, _minima, _, _ = _rolling_extrema(
+            values, self.true_range_lookback, first_row
+        )
+        _current = values[first_row:]
+        _true_range = np.maximum(
+            np.maximum(_maxima - _minima, np.abs(_maxima - _current)),
+            np.abs(_minima - _current),
         )
 
+        _min_periods = (
+            self.true_range_lookback
+            if self.true_range_min_periods is None
+            else self.true_range_min_periods
+        )
+        _true_range[
+            _rolling_count(values, self.true_range_lookback)[first_row:] < _min_periods
+        ] = np.nan
+        return _true_range
+
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
         For your training/initial fit phase (very first fit) use fit_first=True, and for any production/test implementation pass fit_first=False
@@ -65,37 +81,41 @@ class AverageTrueRange:
             Use False, when calculating for subsequent testing/production data { in which case the values, which
             were saved during the last phase, will be utilized for calculation }, by default True
         """
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[
+                (self.true_range_lookback, self.true_range_min_periods),
+                (self.true_range_lookback, self.average_true_range_periods),
+            ],
+        )
         if first_fit:
+            n_cols = 1 if isinstance(dataframe, pd.Series) else dataframe.shape[1]
+            # the last true_range_lookback - 1 values and true ranges are all that is carried
+            self._last_values = _RingBuffer(self.true_range_lookback - 1, n_cols)
+            self._last_true_ranges = _RingBuffer(self.true_range_lookback - 1, n_cols)
 
-            self._true_range_moving_average_object = weighted_window_features()
-            self._average_true_range_moving_average_object = weighted_window_features()
-
-        true_range = (
-            self._true_range_moving_average_object._template_feature_calculation(
-                function_name="true_range",
-                win_function=_equal_window,
-                first_fit=first_fit,
-                dataframe=dataframe,
-                window=self.true_range_lookback,
-                min_periods=self.true_range_min_periods,
-                symmetric=None,
-                operation=self.true_range,
-                operation_args=(),
-            )
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _true_range = self._true_range(
+            np.concatenate((self._last_values.values(), _values)),
+            len(self._last_values),
         )
+        self._last_values.extend(_values)
+
         if self.return_true_range:
-            return true_range
+            return _frame_like(_true_range, dataframe)
 
-        average_true_range = self._average_true_range_moving_average_object._template_feature_calculation(
-            function_name="average_true_range",
-            win_function=_equal_window,
-            first_fit=first_fit,
-            dataframe=true_range,
+        _average_true_range = _rolling_mean(
+            np.concatenate((self._last_true_ranges.values(), _true_range)),
             window=self.true_range_lookback,
-            min_periods=self.average_true_range_periods,
-            symmetric=None,
-            operation=np.mean,
-            operation_args=(),
+            min_periods=(
+                self.true_range_lookback
+                if self.average_true_range_periods is None
+                else self.average_true_range_periods
+            ),
+            first_row=len(self._last_true_ranges),
         )
+        self._last_true_ranges.extend(_true_range)
 
-        return average_true_range
+        return _frame_like(_average_true_range, dataframe)
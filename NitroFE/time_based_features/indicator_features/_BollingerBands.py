@@ -1,12 +1,10 @@
 import numpy as np
 import pandas as pd
 from typing import Union, Callable
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
-)
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _RingBuffer,
+    _rolling_mean_std,
+    _validate_fit,
 )
 from NitroFE.time_based_features.indicator_features._TypicalValue import TypicalValue
 
@@ -66,64 +64,67 @@ class BollingerBands:
 
         """
 
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_typical_values"),
+            dataframe,
+            rolling=[
+                (
+                    self.moving_average_typical_value_lookback_period,
+                    self.moving_average_typical_value_min_periods,
+                )
+            ],
+        )
         if first_fit:
             self._typical_value_object = TypicalValue(
                 lookback_period=self.typical_value_lookback_period,
                 min_periods=self.typical_value_min_periods,
             )
-            self._ma_bollinger_bands_object = weighted_window_features()
-            self._std_bollinger_bands_object = weighted_window_features()
+            self._last_typical_values = _RingBuffer(
+                self.moving_average_typical_value_lookback_period - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
+            )
 
         _typical_value = self._typical_value_object.fit(
             dataframe=dataframe, first_fit=first_fit
         )
+        _values = _typical_value.to_numpy(dtype=float).reshape(len(_typical_value), -1)
 
-        _moving_average_typical_value = (
-            self._ma_bollinger_bands_object._template_feature_calculation(
-                function_name="moving_average_typical_value",
-                win_function=_identity_window,
-                first_fit=first_fit,
-                dataframe=_typical_value,
-                window=self.moving_average_typical_value_lookback_period,
-                min_periods=self.moving_average_typical_value_min_periods,
-                symmetric=None,
-                operation=np.mean,
-                operation_args=(),
-            )
+        _moving_average_typical_value, _std_typical_value = _rolling_mean_std(
+            np.concatenate((self._last_typical_values.values(), _values)),
+            window=self.moving_average_typical_value_lookback_period,
+            min_periods=(
+                self.moving_average_typical_value_lookback_period
+                if self.moving_average_typical_value_min_periods is None
+                else self.moving_average_typical_value_min_periods
+            ),
+            first_row=len(self._last_typical_values),
         )
+        self._last_typical_values.extend(_values)
 
-        _std_typical_value = (
-            self._std_bollinger_bands_object._template_feature_calculation(
-                function_name="moving_average_typical_value",
-                win_function=_identity_window,
-                first_fit=first_fit,
-                dataframe=_typical_value,
-                window=self.moving_average_typical_value_lookback_period,
-                min_periods=self.moving_average_typical_value_min_periods,
-                symmetric=None,
-                operation=np.std,
-                operation_args=(),
-            )
+        # positive bands on the left, negative bands on the right
+        n_cols = _values.shape[1]
+        _bands = np.empty((len(_values), 2 * n_cols))
+        np.multiply(
+            _std_typical_value,
+            self.standard_deviation_multiplier,
+            out=_bands[:, :n_cols],
         )
-
-        positive_band = (
-            _moving_average_typical_value
-            + self.standard_deviation_multiplier * _std_typical_value
-        )
-
-        negative_band = (
-            _moving_average_typical_value
-            - self.standard_deviation_multiplier * _std_typical_value
+        np.subtract(
+            _moving_average_typical_value, _bands[:, :n_cols], out=_bands[:, n_cols:]
         )
+        _bands[:, :n_cols] += _moving_average_typical_value
 
         if isinstance(dataframe, pd.Series):
             if dataframe.name is None:
-                positive_band.name = "positive_band"
-                negative_band.name = "negative_band"
+                _columns = ["positive_band", "negative_band"]
             else:
-                positive_band.name = positive_band.name + "_positive_band"
-                negative_band.name = negative_band.name + "_negative_band"
-        elif isinstance(dataframe, pd.DataFrame):
-            positive_band.columns = positive_band.columns + "_positive_band"
-            negative_band.columns = negative_band.columns + "_negative_band"
-        return pd.concat([positive_band, negative_band], axis=1)
+                _columns = [
+                    dataframe.name + "_positive_band",
+                    dataframe.name + "_negative_band",
+                ]
+        else:
+            _columns = list(dataframe.columns + "_positive_band") + list(
+                dataframe.columns + "_negative_band"
+            )
+        return pd.DataFrame(_bands, index=dataframe.index, columns=_columns)
@@ -1,12 +1,15 @@
 import numpy as np
 import pandas as pd
 from typing import Union, Callable
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
+from NitroFE.time_based_features.moving_average_features.moving_average_kernels import (
+    _adaptive_moving_average,
 )
 from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
     _equal_window,
-    _identity_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _RingBuffer,
+    _validate_fit,
 )
 
 
@@ -52,49 +55,40 @@ class ElasticSeriesWeightedAverage:
 
         """
 
-        if first_fit:
-            self._object = weighted_window_features()
-
-        rolling_sum = self._object._template_feature_calculation(
-            function_name="_lag_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe_for_weight,
-            window=self.weight_sum_lookback,
-            min_periods=1,
-            symmetric=None,
-            operation=np.sum,
-            operation_args=(),
-        ).fillna(0)
-
         if isinstance(dataframe, pd.Series):
             dataframe = dataframe.to_frame()
 
-        eswa = pd.DataFrame(np.zeros(dataframe.shape), columns=dataframe.columns)
-        print(dataframe.shape)
-        print(eswa)
+        _values = dataframe.to_numpy(dtype=float)
+        _weights = dataframe_for_weight.to_numpy(dtype=float).reshape(
+            len(dataframe_for_weight), -1
+        )
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_eswa"),
+            dataframe_for_weight,
+            rolling=[(self.weight_sum_lookback, 1)],
+        )
         if first_fit:
-            eswa = pd.concat([dataframe.iloc[:1], eswa])
-        else:
-            eswa = pd.concat([self.values_from_last_run, eswa])
-
-        eswa["_iloc"] = np.arange(len(eswa))
-        ll = [x for x in eswa.columns if x != "_iloc"]
-
-        for r1, r2, r3, r4 in zip(
-            dataframe.iterrows(),
-            eswa[1:].iterrows(),
-            dataframe_for_weight.iterrows(),
-            rolling_sum.iterrows(),
-        ):
+            # the average starts from the first value
+            self._last_eswa = _values[:1].copy()
+            self._last_weights = _RingBuffer(
+                self.weight_sum_lookback - 1, _weights.shape[1]
+            )
 
-            previous_eswa = eswa[eswa["_iloc"] == (r2[1]["_iloc"] - 1)][ll]
-            eswa.loc[eswa["_iloc"] == r2[1]["_iloc"], ll] = (
-                previous_eswa.fillna(0)
-                + ((r1[1] - previous_eswa) * (r3[1] / r4[1])).fillna(0)
-            ).values[0]
+        # Wn from a cumulative sum difference, missing weights are skipped
+        _previous_weights = self._last_weights.values()
+        _all_weights = np.concatenate((_previous_weights, _weights))
+        _cumulative = np.zeros((len(_all_weights) + 1, _all_weights.shape[1]))
+        np.cumsum(np.nan_to_num(_all_weights), axis=0, out=_cumulative[1:])
+        _ends = np.arange(len(_previous_weights), len(_all_weights)) + 1
+        _starts = np.maximum(_ends - self.weight_sum_lookback, 0)
+        _weight_sum = _cumulative[_ends] - _cumulative[_starts]
+        self._last_weights.extend(_weights)
 
-        res = eswa.iloc[1:][ll]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eswa = _adaptive_moving_average(
+                _values, _weights / _weight_sum, self._last_eswa[0], fill_missing=True
+            )
+        self._last_eswa = np.concatenate((self._last_eswa, eswa))[-1:]
 
-        self.values_from_last_run = eswa.iloc[-1:]
-        return res
+        return pd.DataFrame(eswa, columns=dataframe.columns, index=dataframe.index)
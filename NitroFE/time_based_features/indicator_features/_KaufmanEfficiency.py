@@ -1,33 +1,30 @@
 import numpy as np
 import pandas as pd
 from typing import Union, Callable
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _RingBuffer,
+    _validate_fit,
 )
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
+from NitroFE.time_based_features.moving_average_features.moving_average_kernels import (
+    _kaufman_efficiency,
 )
 
 
 class KaufmanEfficiency:
-    def __init__(self, lookback_period: int = 4, min_periods: int = None):
+    def __init__(self, lookback_period: Union[int, list] = 4, min_periods: int = None):
         """
         Parameters
         ----------
-        lookback_period : int, optional
-            Size of the rolling window for lookback, by default 4
+        lookback_period : Union[int, list], optional
+            Size of the rolling window for lookback, a list of sizes returns one efficiency ratio
+            per (column, lookback period) pair, by default 4
         min_periods : int, optional
             Minimum number of observations in window required to have a value, by default None
         """
         self.lookback_period = lookback_period
         self.min_periods = min_periods
 
-    def _calculate_kaufman_efficiency(self, x):
-        up = np.abs(x.iloc[-1] - x.iloc[0])
-        down = np.abs(x.diff().fillna(0)).sum()
-        return up / down
-
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
         For your training/initial fit phase (very first fit) use fit_first=True, and for any production/test implementation pass fit_first=False
@@ -43,21 +40,48 @@ class KaufmanEfficiency:
             were saved during the last phase, will be utilized for calculation }, by default True
         """
 
+        _lookback_periods = (
+            list(self.lookback_period)
+            if isinstance(self.lookback_period, (list, tuple))
+            else [self.lookback_period]
+        )
+
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[
+                (_lookback_period, self.min_periods)
+                for _lookback_period in _lookback_periods
+            ],
+        )
         if first_fit:
-            self._kaufman_efficiency_object = weighted_window_features()
-
-        _kaufman_efficiency = (
-            self._kaufman_efficiency_object._template_feature_calculation(
-                function_name="kaufman_efficiency",
-                win_function=_identity_window,
-                first_fit=first_fit,
-                dataframe=dataframe,
-                window=self.lookback_period,
-                min_periods=self.min_periods,
-                symmetric=None,
-                operation=self._calculate_kaufman_efficiency,
-                operation_args=(),
+            self._last_values = _RingBuffer(
+                max(_lookback_periods) - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
             )
+
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _efficiency_ratio = _kaufman_efficiency(
+            np.concatenate((self._last_values.values(), _values)),
+            _lookback_periods,
+            self.min_periods,
+            first_row=len(self._last_values),
         )
+        self._last_values.extend(_values)
+
+        if not isinstance(self.lookback_period, (list, tuple)):
+            return _frame_like(_efficiency_ratio[:, :, 0], dataframe)
 
-        return _kaufman_efficiency
+        _columns = (
+            [dataframe.name]
+            if isinstance(dataframe, pd.Series)
+            else list(dataframe.columns)
+        )
+        return pd.DataFrame(
+            _efficiency_ratio.reshape(len(_values), -1),
+            index=dataframe.index,
+            columns=pd.MultiIndex.from_product(
+                [_columns, _lookback_periods], names=["column", "lookback_period"]
+            ),
+        )
@@ -1,12 +1,11 @@
 import numpy as np
 import pandas as pd
 from typing import Union
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
-)
 from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
     _equal_window,
-    _identity_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _validate_fit,
 )
 from NitroFE.time_based_features.moving_average_features.moving_average_features import (
     ExponentialMovingFeature,
@@ -28,15 +27,6 @@ class RelativeStrengthIndex:
         """
         self.lookback_period = lookback_period
 
-    def _diff_pos(self, x):
-        diff_val = x.iloc[-1] - x.iloc[-2]
-        return diff_val if diff_val > 0 else 0
-
-    def _diff_neg(self, x):
-        diff_val = x.iloc[-1] - x.iloc[-2]
-        res = diff_val if diff_val < 0 else 0
-        return -res
-
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
 
@@ -55,50 +45,30 @@ class RelativeStrengthIndex:
             were saved during the last phase, will be utilized for calculation }, by default True
         """
 
-        if first_fit:
-            self._up_object = weighted_window_features()
-            self._down_object = weighted_window_features()
-
-            self._up_smoothed = SmoothedMovingAverage(
-                lookback_period=self.lookback_period
-            )
-            self._down_smoothed = SmoothedMovingAverage(
-                lookback_period=self.lookback_period
-            )
-
         if isinstance(dataframe, pd.Series):
             dataframe = dataframe.to_frame()
 
-        up_value = self._up_object._template_feature_calculation(
-            function_name="_up_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=2,
-            min_periods=None,
-            symmetric=None,
-            operation=self._diff_pos,
-            operation_args=(),
-        )
-
-        down_value = self._down_object._template_feature_calculation(
-            function_name="_down_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=2,
-            min_periods=None,
-            symmetric=None,
-            operation=self._diff_neg,
-            operation_args=(),
-        )
+        _values = dataframe.to_numpy(dtype=float)
+        _validate_fit(first_fit, hasattr(self, "_last_value"))
+        if first_fit:
+            # the first row has no previous value to move from
+            self._last_value = np.full((1, _values.shape[1]), np.nan)
+            self._smoothed = SmoothedMovingAverage(lookback_period=self.lookback_period)
 
-        smoothed_up_value = self._up_smoothed.fit(
-            dataframe=up_value, first_fit=first_fit
-        )
-        smoothed_down_value = self._down_smoothed.fit(
-            dataframe=down_value, first_fit=first_fit
-        )
+        # up and down moves side by side, a move with a missing end stays missing
+        _all_values = np.concatenate((self._last_value, _values))
+        _difference = np.diff(_all_values, axis=0)
+        _moves = np.concatenate((_difference, -_difference), axis=1)
+        _moves[_moves <= 0] = 0
+        self._last_value = _all_values[-1:]
 
-        rsi = 100 - 100 / (1 + (smoothed_up_value / smoothed_down_value))
-        return rsi
+        # both Wilder smoothings run as one recursive filter over the 2 * n_cols channels
+        _smoothed_moves = self._smoothed.fit(
+            dataframe=pd.DataFrame(_moves), first_fit=first_fit
+        ).to_numpy()
+        n_cols = _values.shape[1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (
+                1 + (_smoothed_moves[:, :n_cols] / _smoothed_moves[:, n_cols:])
+            )
+        return pd.DataFrame(rsi, columns=dataframe.columns, index=dataframe.index)
@@ -1,12 +1,14 @@
 import numpy as np
 import pandas as pd
 from typing import Union
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
-)
 from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
     _equal_window,
-    _identity_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _lagged_values,
+    _RingBuffer,
+    _validate_fit,
 )
 from NitroFE.time_based_features.moving_average_features.moving_average_features import (
     TripleExponentialMovingFeature,
@@ -66,9 +68,6 @@ class TripleExponentialMovingAverageOscillator:
         self.initialize_using_operation = initialize_using_operation
         self.initialize_span = initialize_span
 
-    def _ocs_value(self, x):
-        return (x.iloc[-1] - x.iloc[0]) / x.iloc[0]
-
     def fit(
         self,
         dataframe: Union[pd.DataFrame, pd.Series],
@@ -89,6 +88,7 @@ class TripleExponentialMovingAverageOscillator:
             were saved during the last phase, will be utilized for calculation }, by default True
         """
 
+        _validate_fit(first_fit, hasattr(self, "_last_values"))
         if first_fit:
             self._osc_object = TripleExponentialMovingFeature(
                 com=self.com,
@@ -103,19 +103,20 @@ class TripleExponentialMovingAverageOscillator:
                 initialize_span=self.initialize_span,
                 times=self.times,
             )
-            self._difference_object = weighted_window_features()
+            # the last moving feature value is all the oscillator carries
+            self._last_values = _RingBuffer(
+                1, 1 if isinstance(dataframe, pd.Series) else dataframe.shape[1]
+            )
 
         res = self._osc_object.fit(dataframe=dataframe, first_fit=first_fit)
 
-        res = self._difference_object._template_feature_calculation(
-            function_name="triple_exponential_moving_average_oscillator",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=res,
-            window=2,
-            min_periods=None,
-            symmetric=None,
-            operation=self._ocs_value,
-            operation_args=(),
+        _values = res.to_numpy(dtype=float).reshape(len(res), -1)
+        _current, _previous = _lagged_values(
+            np.concatenate((self._last_values.values(), _values)),
+            1,
+            len(self._last_values),
         )
-        return res
+        self._last_values.extend(_values)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return _frame_like((_current - _previous) / _previous, res)
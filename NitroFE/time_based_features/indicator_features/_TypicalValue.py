@@ -1,12 +1,12 @@
 import numpy as np
 import pandas as pd
 from typing import Union, Callable
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
-)
-from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
-    _equal_window,
-    _identity_window,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _RingBuffer,
+    _rolling_count,
+    _rolling_extrema,
+    _validate_fit,
 )
 
 
@@ -23,9 +23,6 @@ class TypicalValue:
         self.lookback_period = lookback_period
         self.min_periods = min_periods
 
-    def _calculate_typical_value(self, x):
-        return (np.max(x) + np.min(x) + x.iloc[-1:]) / 3
-
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
         For your training/initial fit phase (very first fit) use fit_first=True, and for any production/test implementation pass fit_first=False
@@ -42,19 +39,33 @@ class TypicalValue:
 
         """
 
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[(self.lookback_period, self.min_periods)],
+        )
         if first_fit:
-            self._typical_value_object = weighted_window_features()
-
-        _typical_value = self._typical_value_object._template_feature_calculation(
-            function_name="typical_value",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=self.lookback_period,
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._calculate_typical_value,
-            operation_args=(),
+            self._last_values = _RingBuffer(
+                self.lookback_period - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
+            )
+
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _all_values = np.concatenate((self._last_values.values(), _values))
+        _first_row = len(self._last_values)
+        self._last_values.extend(_values)
+
+        _maxima, _minima, _, _ = _rolling_extrema(
+            _all_values, self.lookback_period, _first_row
+        )
+        _typical_value = (_maxima + _minima + _values) / 3
+        _min_periods = (
+            self.lookback_period if self.min_periods is None else self.min_periods
         )
+        _typical_value[
+            _rolling_count(_all_values, self.lookback_period)[_first_row:]
+            < _min_periods
+        ] = np.nan
 
-        return _typical_value
+        return _frame_like(_typical_value, dataframe)
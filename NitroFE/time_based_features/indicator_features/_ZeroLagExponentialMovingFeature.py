@@ -1,12 +1,14 @@
 import numpy as np
 import pandas as pd
 from typing import Union
-from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
-    weighted_window_features,
-)
 from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
     _equal_window,
-    _identity_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _frame_like,
+    _lagged_values,
+    _RingBuffer,
+    _validate_fit,
 )
 from NitroFE.time_based_features.moving_average_features.moving_average_features import (
     ExponentialMovingFeature,
@@ -72,9 +74,6 @@ class ZeroLagExponentialMovingFeature:
         self.initialize_using_operation = initialize_using_operation
         self.initialize_span = initialize_span
 
-    def _sub_lag(self, x):
-        return 2 * x.iloc[-1] - x.iloc[0]
-
     def fit(
         self,
         dataframe: Union[pd.DataFrame, pd.Series],
@@ -95,7 +94,17 @@ class ZeroLagExponentialMovingFeature:
             Use False, when calculating for subsequent testing/production data { in which case the values, which
             were saved during the last phase, will be utilized for calculation }, by default True
         """
+        # 2 * x[i] - x[i - lag] over windows of int((lag_period - 1) / 2) values
+        _window = int((self.lag_period - 1) / 2)
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[(_window, None)],
+        )
         if first_fit:
+            if _window < 1:
+                raise ValueError("lag_period should be at least 3")
             self._zlema_object = ExponentialMovingFeature(
                 com=self.com,
                 operation=self.operation,
@@ -109,22 +118,21 @@ class ZeroLagExponentialMovingFeature:
                 axis=self.axis,
                 times=self.times,
             )
-            self._lag_object = weighted_window_features()
+            self._last_values = _RingBuffer(
+                _window - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
+            )
 
-        res = self._lag_object._template_feature_calculation(
-            function_name="_lag_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=int((self.lag_period - 1) / 2),
-            min_periods=None,
-            symmetric=None,
-            operation=self._sub_lag,
-            operation_args=(),
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _current, _lagged = _lagged_values(
+            np.concatenate((self._last_values.values(), _values)),
+            self._last_values.size,
+            len(self._last_values),
         )
+        self._last_values.extend(_values)
 
         res = self._zlema_object.fit(
-            dataframe=res,
+            dataframe=_frame_like(2 * _current - _lagged, dataframe),
             first_fit=first_fit,
         )
 
@@ -7,7 +7,24 @@ from NitroFE.time_based_features.weighted_window_features.weighted_window_featur
 )
 from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
     _equal_window,
-    _identity_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _float_values,
+    _frame_like,
+    _is_linear_operation,
+    _rolling_count,
+    _rolling_extrema,
+    _RingBuffer,
+    _validate_fit,
+)
+from NitroFE.time_based_features.moving_average_features.moving_average_kernels import (
+    _adaptive_moving_average,
+    _ewm_alpha,
+    _exponential_moving_average,
+    _exponential_moving_variance,
+    _hull_moving_average,
+    _kaufman_efficiency,
+    _smoothed_moving_average,
 )
 
 
@@ -98,18 +115,8 @@ class ExponentialMovingFeature:
             Use False, when calculating for subsequent testing/production data { in which case the values, which
             were saved during the last phase, will be utilized for calculation }, by default True
         """
-        if not first_fit:
-            if self.last_values_from_previous_run is None:
-                raise ValueError(
-                    "First fit has not occured before. Kindly run first_fit=True for first fit instance,"
-                    "and then proceed with first_fit=False for subsequent fits "
-                )
-            self.adjust = False
-            dataframe = pd.concat(
-                [self.last_values_from_previous_run, dataframe], axis=0
-            )
-        else:
-
+        _validate_fit(first_fit, self.last_values_from_previous_run is not None)
+        if first_fit:
             if self.initialize_using_operation:
                 self.min_periods = 0
                 if (self.initialize_span is None) and (self.span is None):
@@ -132,6 +139,77 @@ class ExponentialMovingFeature:
                         "In order to use initialize_span, initialize_using_operation must be True"
                     )
 
+            self._recursive = (
+                (self.times is None)
+                and (self.axis == 0)
+                and (_float_values(dataframe) is not None)
+            )
+            self._moments_state = None
+
+        if self._recursive:
+            _return = self._recursive_fit(dataframe)
+        else:
+            _return = self._concatenated_fit(dataframe, first_fit)
+
+        self.last_values_from_previous_run = _return.iloc[-1:]
+        return _return
+
+    def _recursive_fit(self, dataframe: Union[pd.DataFrame, pd.Series]):
+        """
+        Exponential moving mean/variance carrying the recursive accumulators of every column
+        between fits, so that successive fits match a single fit over the whole history
+        """
+        if self._moments_state is None:
+            _validate_fit(
+                True,
+                dataframe=dataframe,
+                ewm=[
+                    dict(
+                        com=self.com,
+                        span=self.span,
+                        halflife=self.halflife,
+                        alpha=self.alpha,
+                        min_periods=self.min_periods,
+                        adjust=self.adjust,
+                        ignore_na=self.ignore_na,
+                        axis=self.axis,
+                    )
+                ],
+            )
+            self._smoothing_factor = _ewm_alpha(
+                com=self.com, span=self.span, halflife=self.halflife, alpha=self.alpha
+            )
+
+        if self.operation == "mean":
+            _kernel = _exponential_moving_average
+        elif self.operation in ("var", "std"):
+            _kernel = _exponential_moving_variance
+        else:
+            raise ValueError(f"Operation {self.operation} not supported")
+
+        _values, self._moments_state = _kernel(
+            _float_values(dataframe),
+            alpha=self._smoothing_factor,
+            min_periods=self.min_periods,
+            ignore_na=self.ignore_na,
+            state=self._moments_state,
+        )
+        if self.operation == "std":
+            _values = np.sqrt(np.maximum(_values, 0))
+        return _frame_like(_values, dataframe)
+
+    def _concatenated_fit(
+        self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool
+    ):
+        """
+        ewm over the last output row followed by the new values, for times based decay and axis=1
+        """
+        if not first_fit:
+            self.adjust = False
+            dataframe = pd.concat(
+                [self.last_values_from_previous_run, dataframe], axis=0
+            )
+
         _dataframe = dataframe.ewm(
             com=self.com,
             span=self.span,
@@ -147,10 +225,125 @@ class ExponentialMovingFeature:
 
         if not first_fit:
             _return = _return.iloc[1:]
-        self.last_values_from_previous_run = _return.iloc[-1:]
         return _return
 
 
+class ExponentialMovingFeatureBank:
+    """
+    Provided dataframe must be in ascending order.
+    """
+
+    def __init__(
+        self,
+        spans: list = None,
+        alphas: list = None,
+        operation: str = "mean",
+        min_periods: int = 0,
+        ignore_na: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        spans : list, optional
+            specify decays in terms of span, one moving feature per span, by default None
+        alphas : list, optional
+            Specify smoothing factors directly, one moving feature per smoothing factor, by default None
+        operation : str, {'mean','var','std'}
+            operation to be performed for the moving features,available operations are 'mean','var','std', by default 'mean'
+        min_periods : int, optional
+            Minimum number of observations in window required to have a value (otherwise result is NA), by default 0
+        ignore_na : bool, optional
+            Ignore missing values when calculating weights, by default False
+        """
+        if (spans is None) == (alphas is None):
+            raise ValueError("Exactly one of spans or alphas is required")
+
+        self.spans = spans
+        self.alphas = alphas
+        self.operation = operation
+        self.min_periods = min_periods if min_periods != None else 0
+        self.ignore_na = ignore_na
+
+    def _fit_values(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool):
+        """
+        (n_rows, n_cols, n_spans) array of the moving features
+        """
+        if self.operation == "mean":
+            _kernel = _exponential_moving_average
+        elif self.operation in ("var", "std"):
+            _kernel = _exponential_moving_variance
+        else:
+            raise ValueError(f"Operation {self.operation} not supported")
+
+        _decays = self.spans if self.spans is not None else self.alphas
+        _decay_name = "span" if self.spans is not None else "alpha"
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_moments_states"),
+            ewm=[
+                {"min_periods": self.min_periods, _decay_name: _decay}
+                for _decay in _decays
+            ],
+        )
+        if first_fit:
+            self._smoothing_factors = [
+                _ewm_alpha(**{_decay_name: _decay}) for _decay in _decays
+            ]
+            self._moments_states = [None] * len(_decays)
+
+        _values = _float_values(dataframe)
+        # every input column of a span is filtered in one pass, into its own slots of the output
+        _return = np.empty((len(_values), _values.shape[1], len(_decays)))
+        for _iter, _smoothing_factor in enumerate(self._smoothing_factors):
+            _return[:, :, _iter], self._moments_states[_iter] = _kernel(
+                _values,
+                alpha=_smoothing_factor,
+                min_periods=self.min_periods,
+                ignore_na=self.ignore_na,
+                state=self._moments_states[_iter],
+            )
+        if self.operation == "std":
+            _return = np.sqrt(np.maximum(_return, 0))
+        return _return
+
+    def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
+        """
+        For your training/initial fit phase (very first fit) use fit_first=True, and for any production/test implementation pass fit_first=False
+
+        Parameters
+        ----------
+        dataframe : Union[pd.DataFrame, pd.Series]
+            dataframe containing column values to create exponential moving features over
+        first_fit : bool, optional
+            Moving features require past values for calculation.
+            Use True, when calculating for training data (very first fit)
+            Use False, when calculating for subsequent testing/production data { in which case the values, which
+            were saved during the last phase, will be utilized for calculation }, by default True
+
+        Returns
+        -------
+        pd.DataFrame
+            one column per (input column, span/alpha) pair, under a two level column index.
+            Every column equals ExponentialMovingFeature with that span/alpha
+        """
+        _values = self._fit_values(dataframe=dataframe, first_fit=first_fit)
+        _decays = self.spans if self.spans is not None else self.alphas
+        _decay_name = "span" if self.spans is not None else "alpha"
+        _columns = (
+            [dataframe.name]
+            if isinstance(dataframe, pd.Series)
+            else list(dataframe.columns)
+        )
+
+        return pd.DataFrame(
+            _values.reshape(len(_values), -1),
+            index=dataframe.index,
+            columns=pd.MultiIndex.from_product(
+                [_columns, list(_decays)], names=["column", _decay_name]
+            ),
+        )
+
+
 class HullMovingFeature:
     """
     Provided dataframe must be in ascending order.
@@ -198,14 +391,40 @@ class HullMovingFeature:
             were saved during the last phase, will be utilized for calculation }, by default True
 
         """
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_fused"),
+            dataframe,
+            rolling=[
+                (_window, self.min_periods)
+                for _window in (
+                    self.window,
+                    self.window_by_two,
+                    self.window_square_root,
+                )
+            ],
+        )
         if first_fit:
-            self._window_size_weighted_moving_average_object = (
-                weighted_window_features()
+            _values = _float_values(dataframe)
+            self._fused = _is_linear_operation(self.operation, ()) and (
+                _values is not None
             )
-            self._window_by_two_size_weighted_moving_average_object = (
-                weighted_window_features()
-            )
-            self._hma_object = weighted_window_features()
+            if self._fused:
+                self._last_values = _RingBuffer(self.window - 1, _values.shape[1])
+                self._last_raw_hma = _RingBuffer(
+                    self.window_square_root - 1, _values.shape[1]
+                )
+            else:
+                self._window_size_weighted_moving_average_object = (
+                    weighted_window_features()
+                )
+                self._window_by_two_size_weighted_moving_average_object = (
+                    weighted_window_features()
+                )
+                self._hma_object = weighted_window_features()
+
+        if self._fused:
+            return self._fused_fit(dataframe)
 
         window_size_weighted_moving_average = self._window_size_weighted_moving_average_object.caluclate_weighted_moving_window_feature(
             dataframe=dataframe,
@@ -237,19 +456,30 @@ class HullMovingFeature:
 
         return hma
 
+    def _fused_fit(self, dataframe: Union[pd.DataFrame, pd.Series]):
+        """
+        Hull moving average of a linear operation, as the three weighted moving averages of one
+        function over the input and the last window-1 input / sqrt(window)-1 raw hull rows
+        """
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        hma, raw_hma = _hull_moving_average(
+            np.concatenate((self._last_values.values(), _values)),
+            self._last_raw_hma.values(),
+            windows=(self.window, self.window_by_two, self.window_square_root),
+            min_periods=self.min_periods,
+            mean=self.operation is np.mean,
+            first_row=len(self._last_values),
+        )
+        self._last_values.extend(_values)
+        self._last_raw_hma.extend(raw_hma)
+
+        return _frame_like(hma, dataframe)
+
 
 class _a_kaufman_efficiency:
     def __init__(self):
         pass
 
-    def _calculate_kaufman_efficiency(self, x):
-        up = np.abs(x.iloc[-1] - x.iloc[0])
-        down = np.abs(x.diff().fillna(0)).sum()
-        if down == 0:
-            return 0
-        else:
-            return up / down
-
     def fit(
         self,
         dataframe: Union[pd.DataFrame, pd.Series],
@@ -258,26 +488,31 @@ class _a_kaufman_efficiency:
         min_periods: int = None,
     ):
 
+        _validate_fit(
+            first_fit,
+            hasattr(self, "_last_values"),
+            dataframe,
+            rolling=[(lookback_period, min_periods)],
+        )
         if first_fit:
-            self._kaufman_efficiency_object = weighted_window_features()
             self.lookback_period = lookback_period
             self.min_periods = min_periods
-
-        _kaufman_efficiency = (
-            self._kaufman_efficiency_object._template_feature_calculation(
-                function_name="kaufman_efficiency",
-                win_function=_identity_window,
-                first_fit=first_fit,
-                dataframe=dataframe,
-                window=self.lookback_period,
-                min_periods=self.min_periods,
-                symmetric=None,
-                operation=self._calculate_kaufman_efficiency,
-                operation_args=(),
+            self._last_values = _RingBuffer(
+                self.lookback_period - 1,
+                1 if isinstance(dataframe, pd.Series) else dataframe.shape[1],
             )
+
+        _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+        _efficiency_ratio = _kaufman_efficiency(
+            np.concatenate((self._last_values.values(), _values)),
+            [self.lookback_period],
+            self.min_periods,
+            first_row=len(self._last_values),
+            zero_volatility=0,
         )
+        self._last_values.extend(_values)
 
-        return _kaufman_efficiency
+        return _frame_like(_efficiency_ratio[:, :, 0], dataframe)
 
 
 class KaufmanAdaptiveMovingAverage:
@@ -331,24 +566,17 @@ class KaufmanAdaptiveMovingAverage:
         if isinstance(dataframe, pd.Series):
             dataframe = dataframe.to_frame()
 
-        kma = pd.DataFrame(
-            np.zeros(dataframe.shape), columns=dataframe.columns, index=dataframe.index
-        )
         if first_fit:
-            kma = pd.concat(
-                [pd.DataFrame(np.zeros((1, kma.shape[1])), columns=kma.columns), kma]
-            )
             if self.kaufman_efficiency_min_periods == None:
                 _first_pervious = self.kaufman_efficiency_lookback_period - 2
             elif self.kaufman_efficiency_min_periods > 1:
                 _first_pervious = self.kaufman_efficiency_min_periods - 2
             else:
                 _first_pervious = 0
-
+            _previous_kama = np.zeros(dataframe.shape[1])
         else:
-            kma = pd.concat([self.values_from_last_run, kma])
             _first_pervious = -1
-        kma["_iloc"] = np.arange(len(kma))
+            _previous_kama = self.values_from_last_run.to_numpy(dtype=float)[0]
 
         _kaufman_efficiency = self._kaufman_object.fit(
             dataframe=dataframe,
@@ -357,7 +585,6 @@ class KaufmanAdaptiveMovingAverage:
             min_periods=self.kaufman_efficiency_min_periods,
         )
 
-        ll = [x for x in kma.columns if x != "_iloc"]
         SC = (
             _kaufman_efficiency.copy()
             * (2 / (self.fast_ema_span + 1) - 2 / (self.slow_ema_span + 1))
@@ -367,20 +594,13 @@ class KaufmanAdaptiveMovingAverage:
         if first_fit:
             SC.iloc[_first_pervious] = [0] * SC.shape[1]
 
-        for r1, r2, r3 in zip(
-            dataframe[(_first_pervious + 1) :].iterrows(),
-            kma[(1 + _first_pervious + 1) :].iterrows(),
-            SC[(_first_pervious + 1) :].iterrows(),
-        ):
-
-            previous_kama = kma[kma["_iloc"] == (r2[1]["_iloc"] - 1)][ll]
-
-            kma.loc[kma["_iloc"] == r2[1]["_iloc"], ll] = (
-                previous_kama
-                + np.multiply(r3[1].values, (r1[1].values - previous_kama.values))
-            ).values[0]
-
-        res = kma.iloc[1:][ll]
+        kma = np.zeros(dataframe.shape)
+        kma[(_first_pervious + 1) :] = _adaptive_moving_average(
+            dataframe.to_numpy(dtype=float)[(_first_pervious + 1) :],
+            SC.to_numpy(dtype=float)[(_first_pervious + 1) :],
+            _previous_kama,
+        )
+        res = pd.DataFrame(kma, columns=dataframe.columns, index=dataframe.index)
 
         self.values_from_last_run = res.iloc[-1:]
 
@@ -404,12 +624,40 @@ class FractalAdaptiveMovingAverage:
         self.lookback_period = lookback_period
         self.min_periods = min_periods
 
-    def _first_lb(self, x, first_len):
-        return (np.max(x) - np.min(x)) / first_len
+    def _fractal_ranges(self, values: np.ndarray, first_row: int):
+        """
+        Price ranges of the recent half window, the older half window and the whole window,
+        each divided by its length, for rows from first_row. Earlier rows only serve as history.
+        """
+        _half = int((self.lookback_period) / 2)
+        _half_min_periods = _half if self.min_periods is None else self.min_periods
+        _min_periods = (
+            self.lookback_period if self.min_periods is None else self.min_periods
+        )
+
+        _half_max, _half_min, _, _ = _rolling_extrema(values, _half)
+        _max, _min, _, _ = _rolling_extrema(values, self.lookback_period)
+        _half_valid = _rolling_count(values, _half)[first_row:] >= _half_min_periods
+        _valid = (
+            _rolling_count(values, self.lookback_period)[first_row:] >= _min_periods
+        )
+
+        _rows = np.arange(first_row, len(values))
+        # the older half of the window ending at row i is the half window ending at row _older
+        _older = np.maximum(
+            np.minimum(_rows, _half - 1), _rows - self.lookback_period + _half
+        )
 
-    def _second_lb(self, x, first_len):
-        half = int((first_len) / 2)
-        return (np.max(x.iloc[:half]) - np.min(x.iloc[:half])) / half
+        first_res = np.where(
+            _half_valid, (_half_max[_rows] - _half_min[_rows]) / _half, np.nan
+        )
+        second_res = np.where(
+            _valid, (_half_max[_older] - _half_min[_older]) / _half, np.nan
+        )
+        third_res = np.where(
+            _valid, (_max[_rows] - _min[_rows]) / self.lookback_period, np.nan
+        )
+        return first_res, second_res, third_res
 
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
         """
@@ -426,86 +674,57 @@ class FractalAdaptiveMovingAverage:
             were saved during the last phase, will be utilized for calculation }, by default True
         """
 
-        if first_fit:
-            self._first_object = weighted_window_features()
-            self._second_object = weighted_window_features()
-            self._third_object = weighted_window_features()
-
         if isinstance(dataframe, pd.Series):
             dataframe = dataframe.to_frame()
 
-        fama = pd.DataFrame(
-            np.zeros(dataframe.shape), columns=dataframe.columns, index=dataframe.index
-        )
         if first_fit:
-            fama = pd.concat(
-                [pd.DataFrame(np.zeros((1, fama.shape[1])), columns=fama.columns), fama]
+            if int((self.lookback_period) / 2) < 1:
+                raise ValueError(
+                    f"lookback_period should be at least 2, received {self.lookback_period}"
+                )
+            _validate_fit(
+                first_fit,
+                dataframe=dataframe,
+                rolling=[
+                    (int((self.lookback_period) / 2), self.min_periods),
+                    (self.lookback_period, self.min_periods),
+                ],
             )
-        else:
-            fama = pd.concat([self.values_from_last_run, fama])
-        fama["_iloc"] = np.arange(len(fama))
-        ll = [x for x in fama.columns if x != "_iloc"]
-
-        first_res = self._first_object._template_feature_calculation(
-            function_name="_first_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=int((self.lookback_period) / 2),
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._first_lb,
-            operation_args=(int((self.lookback_period) / 2)),
-        )
 
-        second_res = self._second_object._template_feature_calculation(
-            function_name="_second_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=self.lookback_period,
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._second_lb,
-            operation_args=(self.lookback_period),
-        )
+            self._last_values = _RingBuffer(
+                max(self.lookback_period - 1, 0), dataframe.shape[1]
+            )
+            _previous_fama = np.zeros(dataframe.shape[1])
+        else:
+            _previous_fama = self.values_from_last_run.to_numpy(dtype=float)[0]
 
-        third_res = self._third_object._template_feature_calculation(
-            function_name="_third_object",
-            win_function=_identity_window,
-            first_fit=first_fit,
-            dataframe=dataframe,
-            window=self.lookback_period,
-            min_periods=self.min_periods,
-            symmetric=None,
-            operation=self._first_lb,
-            operation_args=(self.lookback_period),
+        _values = dataframe.to_numpy(dtype=float)
+        _first_row = len(self._last_values)
+        first_res, second_res, third_res = self._fractal_ranges(
+            np.concatenate((self._last_values.values(), _values)), _first_row
         )
-        fractal_dimension = (
-            np.log(second_res + first_res) - np.log(third_res)
-        ) / np.log(2)
-        a_value = np.exp(-4.6 * (fractal_dimension - 1)).fillna(0)
-        a_value = pd.DataFrame(
-            np.where(a_value < 0.01, 0.01, a_value), columns=a_value.columns
+        self._last_values.extend(_values)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            fractal_dimension = (
+                np.log(second_res + first_res) - np.log(third_res)
+            ) / np.log(2)
+            a_value = np.exp(-4.6 * (fractal_dimension - 1))
+            a_value = np.where(np.isnan(a_value), 0, a_value)
+            a_value = np.where(a_value < 0.01, 0.01, a_value)
+
+            FC = (self.lookback_period) / 2
+            SC = self.lookback_period
+            oldN = (2 - a_value) / a_value
+            newN = ((SC - FC) * (oldN - 1) / (SC - 1)) + FC
+            a_value = 2 / (newN + 1)
+
+        res = pd.DataFrame(
+            _adaptive_moving_average(_values, a_value, _previous_fama),
+            columns=dataframe.columns,
+            index=dataframe.index,
         )
 
-        FC = (self.lookback_period) / 2
-        SC = self.lookback_period
-        oldN = (2 - a_value) / a_value
-        newN = ((SC - FC) * (oldN - 1) / (SC - 1)) + FC
-        a_value = 2 / (newN + 1)
-
-        for r1, r2, r3 in zip(
-            dataframe.iterrows(), fama[1:].iterrows(), a_value.iterrows()
-        ):
-            previous_kama = fama[fama["_iloc"] == (r2[1]["_iloc"] - 1)][ll]
-            fama.loc[fama["_iloc"] == r2[1]["_iloc"], ll] = (
-                np.multiply(previous_kama.values, (1 - r3[1].values))
-                + np.multiply(r1[1].values, r3[1].values)
-            )[0]
-
-        res = fama.iloc[1:][ll]
-
         self.values_from_last_run = res.iloc[-1:]
         return res
 
@@ -568,6 +787,53 @@ class TripleExponentialMovingFeature:
         self.initialize_using_operation = initialize_using_operation
         self.initialize_span = initialize_span
 
+    def _fused_fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool):
+        """
+        Triple exponential moving average as three cascaded ewm(adjust=False).mean() stages over
+        float arrays, carrying one (weighted, old_wt, nobs) state per stage and column
+        """
+        _min_periods = self.min_periods if self.min_periods != None else 0
+        if first_fit:
+            if self.initialize_span is not None:
+                raise ValueError(
+                    "In order to use initialize_span, initialize_using_operation must be True"
+                )
+            _validate_fit(
+                first_fit,
+                dataframe=dataframe,
+                ewm=[
+                    dict(
+                        com=self.com,
+                        span=self.span,
+                        halflife=self.halflife,
+                        alpha=self.alpha,
+                        min_periods=_min_periods,
+                        adjust=False,
+                        ignore_na=self.ignore_na,
+                        axis=self.axis,
+                    )
+                ],
+            )
+            self._smoothing_factor = _ewm_alpha(
+                com=self.com, span=self.span, halflife=self.halflife, alpha=self.alpha
+            )
+            self._stage_states = [None, None, None]
+
+        _stage_values = _float_values(dataframe)
+        _stages = []
+        for _stage in range(3):
+            _stage_values, _state = _exponential_moving_average(
+                _stage_values,
+                alpha=self._smoothing_factor,
+                min_periods=_min_periods,
+                ignore_na=self.ignore_na,
+                state=self._stage_states[_stage],
+            )
+            self._stage_states[_stage] = _state
+            _stages.append(_stage_values)
+
+        return _frame_like(3 * _stages[0] - 3 * _stages[1] + _stages[2], dataframe)
+
     def fit(self, dataframe: Union[pd.DataFrame, pd.Series], first_fit: bool = True):
 
         """
@@ -584,6 +850,16 @@ class TripleExponentialMovingFeature:
             were saved during the last phase, will be utilized for calculation }, by default True
 
         """
+        if first_fit:
+            self._fused = (
+                (self.operation == "mean")
+                and (not self.initialize_using_operation)
+                and (self.times is None)
+                and (self.axis == 0)
+            )
+        if self._fused:
+            return self._fused_fit(dataframe=dataframe, first_fit=first_fit)
+
         if first_fit:
             self._first_exponential_average_object = ExponentialMovingFeature(
                 initialize_using_operation=self.initialize_using_operation,
@@ -676,39 +952,25 @@ class SmoothedMovingAverage:
 
         """
 
-        if first_fit:
-            self._first_object = weighted_window_features()
-
         if isinstance(dataframe, pd.Series):
             dataframe = dataframe.to_frame()
 
-        sma = pd.DataFrame(
-            np.zeros(dataframe.shape), columns=dataframe.columns, index=dataframe.index
-        )
+        _values = dataframe.to_numpy(dtype=float)
+        sma = np.zeros(dataframe.shape)
         if first_fit:
-            sma.iloc[self.lookback_period - 1] = (
-                dataframe.iloc[: (self.lookback_period)].sum() / self.lookback_period
+            sma[self.lookback_period - 1] = (
+                np.nansum(_values[: (self.lookback_period)], axis=0)
+                / self.lookback_period
             )
-        else:
-            sma = pd.concat([self.values_from_last_run, sma])
-
-        sma["_iloc"] = np.arange(len(sma))
-        ll = [x for x in sma.columns if x != "_iloc"]
-
-        _start_frame = self.lookback_period if first_fit else 0
-        _start_sma = self.lookback_period if first_fit else 1
-        for r1, r2 in zip(
-            dataframe[_start_frame:].iterrows(), sma[_start_sma:].iterrows()
-        ):
-
-            previous_kama = sma[sma["_iloc"] == (r2[1]["_iloc"] - 1)][ll]
-
-            sma.loc[sma["_iloc"] == r2[1]["_iloc"], ll] = (
-                (previous_kama * (self.lookback_period - 1) + r1[1])
+            self._filter_state = (
+                sma[self.lookback_period - 1 : self.lookback_period]
+                * (self.lookback_period - 1)
                 / self.lookback_period
-            ).values[0]
+            )
 
-        res = sma[ll] if first_fit else sma.iloc[1:][ll]
+        _start = self.lookback_period if first_fit else 0
+        sma[_start:], self._filter_state = _smoothed_moving_average(
+            _values[_start:], self.lookback_period, self._filter_state
+        )
 
-        self.values_from_last_run = res.iloc[-1:]
-        return res
+        return pd.DataFrame(sma, columns=dataframe.columns, index=dataframe.index)
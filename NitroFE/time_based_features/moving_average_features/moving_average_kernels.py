@@ -0,0 +1,580 @@
+from scipy import signal
+import numpy as np
+
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _rolling_count,
+    _weighted_rolling_linear,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
+    _window_coefficients,
+)
+
+
+def _adaptive_moving_average(values, alpha, previous, fill_missing=False):
+    """
+    Adaptive moving average of the columns of a 2-D float array, in one pass over the rows
+
+        result[i] = result[i-1] + alpha[i] * (values[i] - result[i-1])
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    alpha : np.ndarray
+        (n_rows, n_cols) smoothing constant of every value
+    previous : np.ndarray
+        (n_cols,) value preceding the first row, result[-1]
+    fill_missing : bool, optional
+        If True, a missing result[i-1] or update alpha[i] * (values[i] - result[i-1]) counts
+        as zero, by default False
+
+    Returns
+    -------
+    np.ndarray
+        (n_rows, n_cols) float array
+    """
+    _return = np.empty(values.shape)
+    _previous = np.array(previous, dtype=float)
+    for _row in range(len(values)):
+        _update = alpha[_row] * (values[_row] - _previous)
+        if fill_missing:
+            _previous = np.where(np.isnan(_previous), 0, _previous)
+            _update = np.where(np.isnan(_update), 0, _update)
+        _previous = _previous + _update
+        _return[_row] = _previous
+    return _return
+
+
+def _kaufman_efficiency(
+    values, lookback_periods, min_periods, first_row=0, zero_volatility=None
+):
+    """
+    Rolling Kaufman efficiency ratio of the columns of a 2-D float array, for many lookback periods
+
+        efficiency[i] = abs(values[i] - values[start]) / sum(abs(diff(values[start : i + 1])))
+
+    over the last min(i+1, lookback_period) rows, from a lagged difference and one prefix sum
+    of absolute first differences shared by every lookback period. Differences with a missing
+    value are left out of the sum, like diff().fillna(0).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    lookback_periods : list
+        Sizes of the rolling windows
+    min_periods : int
+        Minimum number of observations in window required to have a value,
+        None for the size of each window
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    zero_volatility : float, optional
+        value of windows without any movement, None to divide by zero as is, by default None
+
+    Returns
+    -------
+    np.ndarray
+        (n_rows - first_row, n_cols, n_lookback_periods) float array
+    """
+    n_rows, n_cols = values.shape
+    _return = np.empty((n_rows - first_row, n_cols, len(lookback_periods)))
+
+    _moves = np.zeros(values.shape)
+    _moves[1:] = np.abs(np.diff(values, axis=0))
+    _moves[np.isnan(_moves)] = 0
+    # prefix sums of non negative moves, flat windows give an exact zero
+    _path = np.cumsum(_moves, axis=0)
+
+    _rows = np.arange(first_row, n_rows)
+    for _iter, _lookback_period in enumerate(lookback_periods):
+        _starts = np.maximum(_rows - _lookback_period + 1, 0)
+        _direction = np.abs(values[_rows] - values[_starts])
+        _volatility = _path[_rows] - _path[_starts]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _efficiency = _direction / _volatility
+        if zero_volatility is not None:
+            _efficiency[_volatility == 0] = zero_volatility
+
+        _min_periods = _lookback_period if min_periods is None else min_periods
+        _counts = _rolling_count(values, _lookback_period)[first_row:]
+        _efficiency[_counts < _min_periods] = np.nan
+        _return[:, :, _iter] = _efficiency
+
+    return _return
+
+
+def _smoothed_moving_average(values, lookback_period, zi):
+    """
+    Smoothed moving average of the columns of a 2-D float array, as the first order IIR filter
+
+        result[i] = (result[i-1] * (lookback_period - 1) + values[i]) / lookback_period
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    lookback_period : int
+        Smoothing period
+    zi : np.ndarray
+        (1, n_cols) filter state, result[-1] * (lookback_period - 1) / lookback_period
+
+    Returns
+    -------
+    tuple
+        (result, zf), the (n_rows, n_cols) smoothed values and the filter state after the last row
+    """
+    if len(values) == 0:
+        return np.empty(values.shape), zi
+    return signal.lfilter(
+        [1 / lookback_period],
+        [1, -(lookback_period - 1) / lookback_period],
+        values,
+        axis=0,
+        zi=zi,
+    )
+
+
+def _ewm_alpha(com=None, span=None, halflife=None, alpha=None):
+    """
+    Smoothing factor pandas ewm derives from exactly one of com, span, halflife and alpha
+    """
+    if com is None:
+        if span is not None:
+            com = (span - 1) / 2
+        elif halflife is not None:
+            com = 1 / (1 - np.exp(np.log(0.5) / halflife)) - 1
+        else:
+            com = (1 - alpha) / alpha
+    return 1.0 / (1.0 + float(com))
+
+
+def _observed_runs(observed):
+    """
+    Split a boolean column into runs of equal values.
+
+    Parameters
+    ----------
+    observed : np.ndarray
+        1-D boolean array
+
+    Returns
+    -------
+    zip
+        (start, end, observed) of every run, in order
+    """
+    _bounds = np.flatnonzero(observed[1:] != observed[:-1]) + 1
+    _starts = np.concatenate(([0], _bounds))
+    return zip(_starts, np.append(_bounds, len(observed)), observed[_starts])
+
+
+def _ewma_observed_run(values, alpha, weighted, old_wt):
+    """
+    ewma recursion over rows without missing values, the first row updates the state of the
+    columns and the others, having a settled weight, are filtered with scipy.signal.lfilter.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array without missing values, n_rows > 0
+    alpha : float
+        Smoothing factor
+    weighted : np.ndarray
+        Average of every column before the run, nan where it has not started
+    old_wt : np.ndarray
+        Weight of the previous average of every column
+
+    Returns
+    -------
+    tuple
+        (result, weighted, old_wt) after the last row
+    """
+    _decay = 1.0 - alpha
+    _current = values[0]
+    _started = ~np.isnan(weighted)
+    old_wt = np.where(_started, old_wt * _decay, old_wt)
+    weighted = np.where(
+        _started & (weighted != _current),
+        (old_wt * weighted + alpha * _current) / (old_wt + alpha),
+        weighted,
+    )
+    old_wt = np.where(_started, 1.0, old_wt)
+    weighted = np.where(_started, weighted, _current)
+
+    _return = np.empty(values.shape)
+    _return[0] = weighted
+    if len(values) > 1:
+        _return[1:], _ = signal.lfilter(
+            [alpha], [1, -_decay], values[1:], axis=0, zi=_decay * weighted[None, :]
+        )
+        weighted = _return[-1].copy()
+    return _return, weighted, old_wt
+
+
+def _exponential_moving_average(
+    values, alpha, min_periods=0, ignore_na=False, state=None
+):
+    """
+    ewm(adjust=False).mean() of the columns of a 2-D float array, continued from a previous state.
+
+    Columns without missing values are filtered together with scipy.signal.lfilter, the
+    others run by run: a run of missing values only decays the weight of the average, and
+    a run of observed values is filtered like a column without missing values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    alpha : float
+        Smoothing factor
+    min_periods : int, optional
+        Minimum number of observations required to have a value, by default 0
+    ignore_na : bool, optional
+        Ignore missing values when calculating weights, by default False
+    state : tuple, optional
+        (weighted, old_wt, nobs) arrays of the previous call, None to start afresh, by default None
+
+    Returns
+    -------
+    tuple
+        (result, state), the (n_rows, n_cols) averages and the state after the last row
+    """
+    n_rows, n_cols = values.shape
+    if state is None:
+        state = (np.full(n_cols, np.nan), np.ones(n_cols), np.zeros(n_cols))
+    weighted, old_wt, nobs = (np.array(_state, dtype=float) for _state in state)
+    _decay = 1.0 - alpha
+
+    _return = np.empty((n_rows, n_cols))
+    _observed = ~np.isnan(values)
+    _counts = nobs + np.cumsum(_observed, axis=0)
+
+    if n_rows == 0:
+        return _return, (weighted, old_wt, nobs)
+
+    _complete = _observed.all(axis=0)
+    if _complete.any():
+        _return[:, _complete], weighted[_complete], old_wt[_complete] = (
+            _ewma_observed_run(
+                values[:, _complete], alpha, weighted[_complete], old_wt[_complete]
+            )
+        )
+
+    for _column in np.flatnonzero(~_complete):
+        _weighted = weighted[_column : _column + 1]
+        _old_wt = old_wt[_column : _column + 1]
+        for _start, _end, _run_observed in _observed_runs(_observed[:, _column]):
+            if _run_observed:
+                _return[_start:_end, _column : _column + 1], _weighted, _old_wt = (
+                    _ewma_observed_run(
+                        values[_start:_end, _column : _column + 1],
+                        alpha,
+                        _weighted,
+                        _old_wt,
+                    )
+                )
+            else:
+                _return[_start:_end, _column] = _weighted[0]
+                if not (ignore_na or np.isnan(_weighted[0])):
+                    _old_wt = _old_wt * _decay ** (_end - _start)
+        weighted[_column], old_wt[_column] = _weighted[0], _old_wt[0]
+
+    _return[_counts < min_periods] = np.nan
+    return _return, (weighted, old_wt, _counts[-1])
+
+
+def _ewmcov_observed_run(values, alpha, mean, cov, sum_wt, sum_wt2, old_wt):
+    """
+    ewmcov recursion over rows without missing values, the first row updates the state of
+    the columns and the others, having a settled weight, are filtered with scipy.signal.lfilter.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array without missing values, n_rows > 0
+    alpha : float
+        Smoothing factor
+    mean, cov, sum_wt, sum_wt2, old_wt : np.ndarray
+        State of every column before the run, mean is nan where it has not started
+
+    Returns
+    -------
+    tuple
+        ((cov, sum_wt, sum_wt2), state), the (n_rows, n_cols) covariances and weight sums,
+        and the (mean, cov, sum_wt, sum_wt2, old_wt) state after the last row
+    """
+    _decay = 1.0 - alpha
+    _current = values[0]
+    _started = ~np.isnan(mean)
+    sum_wt = np.where(_started, sum_wt * _decay, sum_wt)
+    sum_wt2 = np.where(_started, sum_wt2 * _decay * _decay, sum_wt2)
+    old_wt = np.where(_started, old_wt * _decay, old_wt)
+
+    _old_mean = mean
+    mean = np.where(
+        _started & (mean != _current),
+        (old_wt * _old_mean + alpha * _current) / (old_wt + alpha),
+        mean,
+    )
+    cov = np.where(
+        _started,
+        (old_wt * (cov + (_old_mean - mean) ** 2) + alpha * (_current - mean) ** 2)
+        / (old_wt + alpha),
+        cov,
+    )
+    sum_wt = np.where(_started, (sum_wt + alpha) / (old_wt + alpha), sum_wt)
+    sum_wt2 = np.where(
+        _started, (sum_wt2 + alpha * alpha) / (old_wt + alpha) ** 2, sum_wt2
+    )
+    old_wt = np.where(_started, 1.0, old_wt)
+    mean = np.where(_started, mean, _current)
+
+    _cov = np.empty(values.shape)
+    _sum_wt = np.empty(values.shape)
+    _sum_wt2 = np.empty(values.shape)
+    _cov[0], _sum_wt[0], _sum_wt2[0] = cov, sum_wt, sum_wt2
+
+    if len(values) > 1:
+        _values = values[1:]
+        _weight = _decay + alpha
+        _means, _ = signal.lfilter(
+            [alpha / _weight],
+            [1, -_decay / _weight],
+            _values,
+            axis=0,
+            zi=(_decay / _weight) * mean[None, :],
+        )
+        _previous_means = np.concatenate((mean[None, :], _means[:-1]))
+        _cov[1:], _ = signal.lfilter(
+            [1 / _weight],
+            [1, -_decay / _weight],
+            _decay * (_previous_means - _means) ** 2 + alpha * (_values - _means) ** 2,
+            axis=0,
+            zi=(_decay / _weight) * cov[None, :],
+        )
+        _ones = np.ones(_values.shape)
+        _sum_wt[1:], _ = signal.lfilter(
+            [alpha / _weight],
+            [1, -_decay / _weight],
+            _ones,
+            axis=0,
+            zi=(_decay / _weight) * sum_wt[None, :],
+        )
+        _sum_wt2[1:], _ = signal.lfilter(
+            [(alpha / _weight) ** 2],
+            [1, -((_decay / _weight) ** 2)],
+            _ones,
+            axis=0,
+            zi=((_decay / _weight) ** 2) * sum_wt2[None, :],
+        )
+        mean, cov = _means[-1].copy(), _cov[-1].copy()
+        sum_wt, sum_wt2 = _sum_wt[-1].copy(), _sum_wt2[-1].copy()
+
+    return (_cov, _sum_wt, _sum_wt2), (mean, cov, sum_wt, sum_wt2, old_wt)
+
+
+def _exponential_moving_variance(
+    values, alpha, min_periods=0, ignore_na=False, state=None
+):
+    """
+    ewm(adjust=False).var() of the columns of a 2-D float array, continued from a previous state.
+
+    The exponentially weighted mean, covariance and weight sums of every column are carried
+    between calls, so successive batches reproduce the variance of the full history.
+    Columns without missing values are filtered together with scipy.signal.lfilter, the
+    others run by run: a run of missing values only decays the weights, and a run of
+    observed values is filtered like a column without missing values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    alpha : float
+        Smoothing factor
+    min_periods : int, optional
+        Minimum number of observations required to have a value, by default 0
+    ignore_na : bool, optional
+        Ignore missing values when calculating weights, by default False
+    state : tuple, optional
+        (mean, cov, sum_wt, sum_wt2, old_wt, nobs) arrays of the previous call,
+        None to start afresh, by default None
+
+    Returns
+    -------
+    tuple
+        (result, state), the (n_rows, n_cols) unbiased variances and the state after the last row
+    """
+    n_rows, n_cols = values.shape
+    if state is None:
+        state = (
+            np.full(n_cols, np.nan),
+            np.zeros(n_cols),
+            np.ones(n_cols),
+            np.ones(n_cols),
+            np.ones(n_cols),
+            np.zeros(n_cols),
+        )
+    mean, cov, sum_wt, sum_wt2, old_wt, nobs = (
+        np.array(_state, dtype=float) for _state in state
+    )
+    _decay = 1.0 - alpha
+
+    _observed = ~np.isnan(values)
+    _counts = nobs + np.cumsum(_observed, axis=0)
+    _cov = np.empty((n_rows, n_cols))
+    _sum_wt = np.empty((n_rows, n_cols))
+    _sum_wt2 = np.empty((n_rows, n_cols))
+
+    if n_rows == 0:
+        return _cov, (mean, cov, sum_wt, sum_wt2, old_wt, nobs)
+
+    _complete = _observed.all(axis=0)
+    if _complete.any():
+        (
+            (_cov[:, _complete], _sum_wt[:, _complete], _sum_wt2[:, _complete]),
+            (
+                mean[_complete],
+                cov[_complete],
+                sum_wt[_complete],
+                sum_wt2[_complete],
+                old_wt[_complete],
+            ),
+        ) = _ewmcov_observed_run(
+            values[:, _complete],
+            alpha,
+            mean[_complete],
+            cov[_complete],
+            sum_wt[_complete],
+            sum_wt2[_complete],
+            old_wt[_complete],
+        )
+
+    for _column in np.flatnonzero(~_complete):
+        _state = tuple(
+            _array[_column : _column + 1]
+            for _array in (mean, cov, sum_wt, sum_wt2, old_wt)
+        )
+        for _start, _end, _run_observed in _observed_runs(_observed[:, _column]):
+            _rows = slice(_start, _end)
+            if _run_observed:
+                (
+                    (
+                        _cov[_rows, _column : _column + 1],
+                        _sum_wt[_rows, _column : _column + 1],
+                        _sum_wt2[_rows, _column : _column + 1],
+                    ),
+                    _state,
+                ) = _ewmcov_observed_run(
+                    values[_rows, _column : _column + 1], alpha, *_state
+                )
+                continue
+            _mean, _run_cov, _run_sum_wt, _run_sum_wt2, _run_old_wt = _state
+            _cov[_rows, _column] = _run_cov[0]
+            if ignore_na or np.isnan(_mean[0]):
+                _sum_wt[_rows, _column] = _run_sum_wt[0]
+                _sum_wt2[_rows, _column] = _run_sum_wt2[0]
+                continue
+            _decays = _decay ** np.arange(1, _end - _start + 1)
+            _sum_wt[_rows, _column] = _run_sum_wt[0] * _decays
+            _sum_wt2[_rows, _column] = _run_sum_wt2[0] * _decays**2
+            _state = (
+                _mean,
+                _run_cov,
+                _run_sum_wt * _decays[-1],
+                _run_sum_wt2 * _decays[-1] ** 2,
+                _run_old_wt * _decays[-1],
+            )
+        (
+            mean[_column],
+            cov[_column],
+            sum_wt[_column],
+            sum_wt2[_column],
+            old_wt[_column],
+        ) = (_array[0] for _array in _state)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _numerator = _sum_wt * _sum_wt
+        _denominator = _numerator - _sum_wt2
+        _return = np.where(_denominator > 0, (_numerator / _denominator) * _cov, np.nan)
+    _return[_counts < min_periods] = np.nan
+
+    return _return, (mean, cov, sum_wt, sum_wt2, old_wt, _counts[-1])
+
+
+def _weighted_moving_average(values, window, min_periods, mean=True, first_row=0):
+    """
+    Linearly weighted rolling sum/mean of the columns of a 2-D float array, matching
+    rolling().agg over _weighted_moving_window, missing values are skipped.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    min_periods : int
+        Minimum number of observations in window required to have a value
+    mean : bool, optional
+        If True, weighted sums are divided by the number of values in the window, by default True
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    """
+    _kernels = [
+        _window_coefficients("weighted_moving", _length)
+        for _length in range(1, window + 1)
+    ]
+    return _weighted_rolling_linear(
+        values, window, min_periods, _kernels, mean=mean, first_row=first_row
+    )
+
+
+def _hull_moving_average(
+    values, raw_history, windows, min_periods, mean=True, first_row=0
+):
+    """
+    Hull moving average of the columns of a 2-D float array
+
+        raw = 2 * wma(values, window / 2) - wma(values, window)
+        hma = wma(raw, sqrt(window))
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    raw_history : np.ndarray
+        (n_history, n_cols) raw hull values of the rows preceding first_row
+    windows : tuple
+        (window, window / 2, sqrt(window)) sizes of the three weighted moving averages
+    min_periods : int
+        Minimum number of observations in window required to have a value,
+        None for the size of each window
+    mean : bool, optional
+        If True, weighted sums are divided by the number of values in the window, by default True
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+
+    Returns
+    -------
+    tuple
+        (hma, raw), the (n_rows - first_row, n_cols) hull moving averages and raw hull values
+    """
+    window, window_by_two, window_square_root = windows
+
+    def _min_periods(_window):
+        return _window if min_periods is None else min_periods
+
+    raw = _weighted_moving_average(
+        values, window_by_two, _min_periods(window_by_two), mean, first_row
+    )
+    raw *= 2
+    raw -= _weighted_moving_average(
+        values, window, _min_periods(window), mean, first_row
+    )
+
+    hma = _weighted_moving_average(
+        np.concatenate((raw_history, raw)),
+        window_square_root,
+        _min_periods(window_square_root),
+        mean,
+        len(raw_history),
+    )
+    return hma, raw
@@ -1,119 +1,565 @@
-from weighted_window_features import (
-    caluclate_equal_feature,
-    caluclate_barthann_feature,
-    caluclate_bartlett_feature,
-    caluclate_blackman_feature,
-    caluclate_blackmanharris_feature,
-    caluclate_bohman_feature,
-    caluclate_cosine_feature,
-    caluclate_exponential_feature,
-    caluclate_flattop_feature,
-    caluclate_gaussian_feature,
-    caluclate_hamming_feature,
-    caluclate_hann_feature,
-    caluclate_kaiser_feature,
-    caluclate_parzen_feature,
-    caluclate_triang_feature,
+from NitroFE.time_based_features.weighted_window_features.weighted_window_features import (
+    weighted_window_features,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
+    _barthann_window,
+    _bartlett_window,
+    _equal_window,
+    _blackman_window,
+    _blackmanharris_window,
+    _bohman_window,
+    _cosine_window,
+    _exponential_window,
+    _flattop_window,
+    _gaussian_window,
+    _hamming_window,
+    _hann_window,
+    _kaiser_window,
+    _parzen_window,
+    _triang_window,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _accepts_axis,
+    _float_values,
+    _is_linear_operation,
+    _weighted_rolling_linear,
+    _weighted_rolling_linear_bank,
+    _weighted_rolling_reduce,
+    _window_kernels,
+    _RingBuffer,
+    _validate_fit,
 )
 
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import inspect
+import os
 import numpy as np
 import pandas as pd
 from typing import Union
 
+_COMMON_PARAMETERS = (
+    "self",
+    "dataframe",
+    "first_fit",
+    "window",
+    "min_periods",
+    "symmetric",
+    "operation",
+    "operation_args",
+)
+
+
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return value
+
+
+def _shared_column_features(
+    input_name: str,
+    input_shape: tuple,
+    column: int,
+    output_name: str,
+    output_shape: tuple,
+    features: list,
+    slots: list,
+):
+    """
+    Process pool task, calculates the compiled features of one input column held in shared memory
+    and writes them into their slots of the shared output array
+    """
+    _input = shared_memory.SharedMemory(name=input_name)
+    _output = shared_memory.SharedMemory(name=output_name)
+    try:
+        _series = pd.Series(
+            np.ndarray(input_shape, dtype=float, buffer=_input.buf)[column].copy()
+        )
+        _out = np.ndarray(output_shape, dtype=float, buffer=_output.buf)
+        weighted_rolling_window_engine()._column_features(
+            _series, features, _out, slots
+        )
+        del _out
+    finally:
+        _input.close()
+        _output.close()
+
 
 class weighted_rolling_window_engine:
     def __init__(self):
+        self.payload = None
+        self.plan = None
+        self.tail = None
         self.function_mapper = {
-            "equal": caluclate_equal_feature,
-            "barthann": caluclate_barthann_feature,
-            "bartlett": caluclate_bartlett_feature,
-            "blackman": caluclate_blackman_feature,
-            "blackmanharris": caluclate_blackmanharris_feature,
-            "bohman": caluclate_bohman_feature,
-            "cosine": caluclate_cosine_feature,
-            "exponential": caluclate_exponential_feature,
-            "flattop": caluclate_flattop_feature,
-            "gaussian": caluclate_gaussian_feature,
-            "hamming": caluclate_hamming_feature,
-            "hann": caluclate_hann_feature,
-            "kaiser": caluclate_kaiser_feature,
-            "parzen": caluclate_parzen_feature,
-            "triang": caluclate_triang_feature,
+            "equal": weighted_window_features.caluclate_equal_feature,
+            "barthann": weighted_window_features.caluclate_barthann_feature,
+            "bartlett": weighted_window_features.caluclate_bartlett_feature,
+            "blackman": weighted_window_features.caluclate_blackman_feature,
+            "blackmanharris": weighted_window_features.caluclate_blackmanharris_feature,
+            "bohman": weighted_window_features.caluclate_bohman_feature,
+            "cosine": weighted_window_features.caluclate_cosine_feature,
+            "exponential": weighted_window_features.caluclate_exponential_feature,
+            "flattop": weighted_window_features.caluclate_flattop_feature,
+            "gaussian": weighted_window_features.caluclate_gaussian_feature,
+            "hamming": weighted_window_features.caluclate_hamming_feature,
+            "hann": weighted_window_features.caluclate_hann_feature,
+            "kaiser": weighted_window_features.caluclate_kaiser_feature,
+            "parzen": weighted_window_features.caluclate_parzen_feature,
+            "triang": weighted_window_features.caluclate_triang_feature,
+        }
+        self.window_function_mapper = {
+            "equal": _equal_window,
+            "barthann": _barthann_window,
+            "bartlett": _bartlett_window,
+            "blackman": _blackman_window,
+            "blackmanharris": _blackmanharris_window,
+            "bohman": _bohman_window,
+            "cosine": _cosine_window,
+            "exponential": _exponential_window,
+            "flattop": _flattop_window,
+            "gaussian": _gaussian_window,
+            "hamming": _hamming_window,
+            "hann": _hann_window,
+            "kaiser": _kaiser_window,
+            "parzen": _parzen_window,
+            "triang": _triang_window,
+        }
+
+    def _parameter_sets(self, window_payload: dict):
+        """
+        Split a window payload into one keyword dict per feature, list values are taken
+        position wise and scalar values are shared by all features
+        """
+        if not isinstance(window_payload["window"], list):
+            return [dict(window_payload)]
+
+        iter_duration = len(window_payload["window"])
+        for _key, _value in window_payload.items():
+            if isinstance(_value, list) and len(_value) != iter_duration:
+                raise ValueError(
+                    f"Payload value '{_key}' has {len(_value)} entries, while 'window' has {iter_duration}"
+                )
+        return [
+            {
+                _key: (_value[_iter] if isinstance(_value, list) else _value)
+                for _key, _value in window_payload.items()
+            }
+            for _iter in range(iter_duration)
+        ]
+
+    def _compile_feature(self, window_key: str, parameter_set: dict):
+        _arguments = inspect.signature(self.function_mapper[window_key]).bind(
+            None, None, **parameter_set
+        )
+        _arguments.apply_defaults()
+        parameters = {
+            _key: _value
+            for _key, _value in _arguments.arguments.items()
+            if _key not in ("self", "dataframe")
         }
+        _validate_fit(True, rolling=[(parameters["window"], parameters["min_periods"])])
+
+        operation = (
+            np.mean if parameters["operation"] is None else parameters["operation"]
+        )
+        operation_args = parameters["operation_args"]
+        if not isinstance(operation_args, tuple):
+            operation_args = (operation_args,)
 
-    def fit(self, dataframe: Union[pd.DataFrame, pd.Series], payload: dict):
+        linear_spec, reduce_spec = None, None
+        _linear = _is_linear_operation(operation, operation_args)
+        if _linear or _accepts_axis(operation, operation_args):
+            _window = parameters["window"]
+            _min_periods = (
+                _window
+                if parameters["min_periods"] is None
+                else parameters["min_periods"]
+            )
+            _kernels = _window_kernels(
+                self.window_function_mapper[window_key],
+                _window,
+                parameters.get("symmetric"),
+                {
+                    _key: _value
+                    for _key, _value in parameters.items()
+                    if _key not in _COMMON_PARAMETERS
+                },
+            )
+            if _linear:
+                linear_spec = (_window, _min_periods, _kernels, operation is np.mean)
+            else:
+                reduce_spec = (
+                    _window,
+                    _min_periods,
+                    _kernels,
+                    operation,
+                    operation_args,
+                )
+        return {
+            "window_key": window_key,
+            "parameters": parameters,
+            "linear_spec": linear_spec,
+            "reduce_spec": reduce_spec,
+        }
+
+    def compile(self, payload: dict):
         """
+        Validate the payload and turn it into a flat execution plan, which fit reuses as long as
+        it is called with the same payload object. Recompile after modifying the payload in place.
+
+        Identical (column, window kind, parameters) features are calculated only once.
+
         Parameters
         ----------
-        dataframe :  Union[pd.DataFrame,pd.Series]
-            dataframe/series over which barthann weighted rolling window feature is to be constructed
         payload : dict
             payload containing feature generation information
 
         Returns
         -------
         dict
+            plan[column]["features"] lists the distinct features to calculate over the column,
+            plan[column]["outputs"][window_kind] lists the feature position of every parameter set
+        """
+        plan = {}
+        for _column_key, _column_payload in payload.items():
+            if "weighted_window_features" not in _column_payload.keys():
+                continue
+
+            features, feature_positions, outputs = [], {}, {}
+            for _window_key, _window_payload in _column_payload[
+                "weighted_window_features"
+            ].items():
+                if _window_key not in self.function_mapper.keys():
+                    continue
+
+                outputs[_window_key] = []
+                for _parameter_set in self._parameter_sets(_window_payload):
+                    _feature = self._compile_feature(_window_key, _parameter_set)
+                    _feature_key = (_window_key,) + tuple(
+                        (_key, _hashable(_value))
+                        for _key, _value in sorted(_feature["parameters"].items())
+                    )
+                    if _feature_key not in feature_positions:
+                        feature_positions[_feature_key] = len(features)
+                        features.append(_feature)
+                    outputs[_window_key].append(feature_positions[_feature_key])
+
+            plan[_column_key] = {"features": features, "outputs": outputs}
+
+        self.payload = payload
+        self.plan = plan
+        self.tail = None
+        return plan
+
+    def _column_features(
+        self, series: pd.Series, features: list, out: np.ndarray, slots: list
+    ):
+        """
+        Calculate the compiled features of one column, feature i is written into out[:, slots[i]].
+
+        Sum/mean features over missing free values are computed together, sharing one prefix sum
+        or one FFT of the column, the remaining ones go through weighted_window_features.
+        """
+        values = _float_values(series)
+        values = None if (values is None) or np.isnan(values).any() else values[:, 0]
+
+        bank_slots, bank_specs = [], []
+        for _slot, _feature in zip(slots, features):
+            if (values is not None) and (_feature["linear_spec"] is not None):
+                bank_slots.append(_slot)
+                bank_specs.append(_feature["linear_spec"])
+            else:
+                out[:, _slot] = self.function_mapper[_feature["window_key"]](
+                    weighted_window_features(), series, **_feature["parameters"]
+                ).to_numpy(dtype=float)
+
+        if bank_specs:
+            out[:, bank_slots] = _weighted_rolling_linear_bank(values, bank_specs)
+
+    def _output_slots(self, output: str):
+        """
+        Output array slot of every compiled feature, per column, along with the output width.
+
+        For 'frame' every parameter set owns a slot and a feature is written into the first slot
+        asking for it, for 'dict' every distinct feature owns a slot.
+        """
+        _slots, _width = {}, 0
+        for _column_key, _column_plan in self.plan.items():
+            if output == "frame":
+                _feature_slots = {}
+                for _positions in _column_plan["outputs"].values():
+                    for _position in _positions:
+                        _feature_slots.setdefault(_position, _width)
+                        _width += 1
+                _slots[_column_key] = [
+                    _feature_slots[_iter] for _iter in range(len(_feature_slots))
+                ]
+            else:
+                _slots[_column_key] = list(
+                    range(_width, _width + len(_column_plan["features"]))
+                )
+                _width += len(_column_plan["features"])
+        return _slots, _width
+
+    def _fill_shared_slots(self, slots: dict, values: np.ndarray):
+        """
+        Copy features shared by several parameter sets from their first slot to the other
+        slots of the frame output
+        """
+        _slot = 0
+        for _column_key, _column_plan in self.plan.items():
+            for _positions in _column_plan["outputs"].values():
+                for _position in _positions:
+                    _feature_slot = slots[_column_key][_position]
+                    if _feature_slot != _slot:
+                        values[:, _slot] = values[:, _feature_slot]
+                    _slot += 1
+
+    def _frame_columns(self):
+        """
+        Column names of the frame output, '<column>_<window kind>_<parameter set position>'
+        """
+        return [
+            f"{_column_key}_{_window_key}_{_iter}"
+            for _column_key, _column_plan in self.plan.items()
+            for _window_key, _positions in _column_plan["outputs"].items()
+            for _iter in range(len(_positions))
+        ]
+
+    def _parallel_features(self, slots: dict, values: np.ndarray, n_jobs: int):
+        """
+        Shard the columns of the plan across a process pool. Input columns and the output array
+        are placed in shared memory, so tasks only carry the compiled features of their column.
+        """
+        _columns = list(self.plan.keys())
+        _input_shape = (len(_columns), len(self.dataframe))
+        _input = shared_memory.SharedMemory(
+            create=True, size=max(1, int(np.prod(_input_shape)) * 8)
+        )
+        _output = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+        try:
+            _input_values = np.ndarray(_input_shape, dtype=float, buffer=_input.buf)
+            for _iter, _column_key in enumerate(_columns):
+                _input_values[_iter] = self.dataframe[_column_key].to_numpy(dtype=float)
+            del _input_values
+
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(_columns))) as _pool:
+                _tasks = [
+                    _pool.submit(
+                        _shared_column_features,
+                        _input.name,
+                        _input_shape,
+                        _iter,
+                        _output.name,
+                        values.shape,
+                        self.plan[_column_key]["features"],
+                        slots[_column_key],
+                    )
+                    for _iter, _column_key in enumerate(_columns)
+                ]
+                for _task in _tasks:
+                    _task.result()
+
+            values[:] = np.ndarray(values.shape, dtype=float, buffer=_output.buf)
+        finally:
+            _input.close()
+            _input.unlink()
+            _output.close()
+            _output.unlink()
+
+    def _save_tail(self):
+        """
+        Keep the last (largest window - 1) values of every planned column, the history update
+        needs to continue the rolling windows
+        """
+        self.tail = {}
+        for _column_key, _column_plan in self.plan.items():
+            _values = _float_values(self.dataframe[_column_key])
+            if _values is None:
+                continue
+            _size = max(
+                [
+                    _feature["parameters"]["window"]
+                    for _feature in _column_plan["features"]
+                ],
+                default=1,
+            )
+            self.tail[_column_key] = _RingBuffer(_size - 1, 1)
+            self.tail[_column_key].extend(_values)
+
+    def _update_feature(self, feature: dict, values: np.ndarray, first_row: int):
+        """
+        Feature values of values[first_row:], earlier values only serve as history
+        """
+        if feature["linear_spec"] is not None:
+            window, min_periods, kernels, mean = feature["linear_spec"]
+            _length = min(len(values), window)
+            if (len(values) - first_row == 1) and not np.isnan(
+                values[-_length:, 0]
+            ).any():
+                if _length < min_periods:
+                    return np.nan
+                _value = kernels[_length - 1] @ values[-_length:, 0]
+                return _value / _length if mean else _value
+            return _weighted_rolling_linear(
+                values, window, min_periods, kernels, mean, first_row
+            )[:, 0]
+
+        if feature["reduce_spec"] is not None:
+            _return = _weighted_rolling_reduce(
+                values, *feature["reduce_spec"], first_row=first_row
+            )
+            if _return is not None:
+                return _return[:, 0]
+        return None
 
+    def update(self, new_rows: Union[pd.DataFrame, dict]):
         """
+        Calculate every planned feature for rows following the ones seen by fit and previous updates.
+
+        Parameters
+        ----------
+        new_rows : Union[pd.DataFrame, dict]
+            new values of the planned columns, as a dataframe or as a dictionary mapping each
+            column to a scalar or an array of new values
+
+        Returns
+        -------
+        Union[pd.DataFrame, np.ndarray]
+            the new feature rows, with the columns of fit(..., output="frame").
+            A float array is returned for dictionary input, which keeps pandas off the path
+            of sum/mean, and of axis accepting operations over values without missing values
+        """
+        if self.tail is None:
+            raise ValueError(
+                "update follows fit. Kindly run fit on the history before calling update"
+            )
+
+        _columns = {
+            _column_key: np.asarray(new_rows[_column_key], dtype=float).reshape(-1, 1)
+            for _column_key in self.plan.keys()
+        }
+        _n_rows = len(next(iter(_columns.values()))) if _columns else 0
+        _slots, _width = self._output_slots("frame")
+        _return = np.empty((_n_rows, _width))
+
+        for _column_key, _column_plan in self.plan.items():
+            if _column_key not in self.tail:
+                raise ValueError(
+                    f"Column '{_column_key}' could not be represented as floats during fit"
+                )
+            _tail = self.tail[_column_key]
+            _history = _tail.values()
+            _values = np.concatenate((_history, _columns[_column_key]))
+            _has_nan = np.isnan(_values).any()
+
+            for _feature, _feature_slot in zip(
+                _column_plan["features"], _slots[_column_key]
+            ):
+                _feature_values = (
+                    None
+                    if _has_nan and (_feature["linear_spec"] is None)
+                    else self._update_feature(_feature, _values, len(_history))
+                )
+                if _feature_values is None:
+                    _feature_values = self.function_mapper[_feature["window_key"]](
+                        weighted_window_features(),
+                        pd.Series(_values[:, 0]),
+                        **_feature["parameters"],
+                    ).to_numpy(dtype=float)[len(_history) :]
+                _return[:, _feature_slot] = _feature_values
+
+            _tail.extend(_columns[_column_key])
+        self._fill_shared_slots(_slots, _return)
+
+        if isinstance(new_rows, pd.DataFrame):
+            return pd.DataFrame(
+                _return, index=new_rows.index, columns=self._frame_columns()
+            )
+        return _return
+
+    def fit(
+        self,
+        dataframe: Union[pd.DataFrame, pd.Series],
+        payload: dict = None,
+        output: str = "dict",
+        n_jobs: int = None,
+    ):
+        """
+        Parameters
+        ----------
+        dataframe :  Union[pd.DataFrame,pd.Series]
+            dataframe/series over which barthann weighted rolling window feature is to be constructed
+        payload : dict, optional
+            payload containing feature generation information, it is compiled when it differs from
+            the last compiled payload. When None, the last compiled plan is used, by default None
+        output : str, optional
+            'dict' returns the nested output dictionary, 'frame' returns a single dataframe holding
+            every feature, by default 'dict'
+        n_jobs : int, optional
+            Number of processes the payload columns are shared out to, -1 uses every cpu.
+            Operations have to be picklable for n_jobs other than None or 1, by default None
+
+        Returns
+        -------
+        Union[dict, pd.DataFrame]
+            for 'dict', output_dict[column]["weighted_window_features"][window_kind] is a dataframe
+            holding one column per parameter set, in payload order.
+            for 'frame', a dataframe with one '<column>_<window kind>_<parameter set position>'
+            column per feature, written into a single preallocated array
+
+        """
+        if output not in ("dict", "frame"):
+            raise ValueError(
+                f"output should be one of 'dict' or 'frame', received '{output}'"
+            )
+        if payload is None:
+            if self.plan is None:
+                raise ValueError(
+                    "No payload has been compiled. Kindly pass a payload to fit, or run compile first"
+                )
+        elif payload is not self.payload:
+            self.compile(payload)
+
         self.output_dict = {}
         self.dataframe = dataframe
-        self.payload = payload
 
-        for _column_key in self.payload.keys():
-
-            if "weighted_window_features" in self.payload[_column_key].keys():
-                self.output_dict[_column_key] = {"weighted_window_features": {}}
-
-                for _window_keys in self.payload[_column_key][
-                    "weighted_window_features"
-                ].keys():
-                    if _window_keys in self.function_mapper.keys():
-
-                        self.output_dict[_column_key]["weighted_window_features"][
-                            _window_keys
-                        ] = {}
-                        dict_all = self.payload[_column_key][
-                            "weighted_window_features"
-                        ][_window_keys]
-
-                        feature_generated = []
-                        if isinstance(
-                            self.payload[_column_key]["weighted_window_features"][
-                                _window_keys
-                            ]["window"],
-                            int,
-                        ):
-                            iter_duration = 1
-                            resulting_feature = self.function_mapper[_window_keys](
-                                self.dataframe[_column_key],
-                                **self.payload[_column_key]["weighted_window_features"][
-                                    _window_keys
-                                ]
-                            )
-                            feature_generated.append(resulting_feature)
-
-                        else:
-                            iter_duration = len(
-                                self.payload[_column_key]["weighted_window_features"][
-                                    _window_keys
-                                ]["window"]
-                            )
-                            for _iter in range(iter_duration):
-                                resulting_feature = self.function_mapper[_window_keys](
-                                    self.dataframe[_column_key],
-                                    **dict(
-                                        zip(
-                                            dict_all.keys(),
-                                            np.array(list(dict_all.values()))[:, _iter],
-                                        )
-                                    )
-                                )
-                                feature_generated.append(resulting_feature)
-
-                        self.output_dict[_column_key]["weighted_window_features"][
-                            _window_keys
-                        ] = feature_generated
+        n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        _slots, _width = self._output_slots(output)
+        _values = np.empty((len(self.dataframe), _width))
+
+        if (n_jobs is not None) and (n_jobs > 1) and (len(self.plan) > 1):
+            self._parallel_features(_slots, _values, n_jobs)
+        else:
+            for _column_key, _column_plan in self.plan.items():
+                self._column_features(
+                    self.dataframe[_column_key],
+                    _column_plan["features"],
+                    _values,
+                    _slots[_column_key],
+                )
+
+        self._save_tail()
+
+        if output == "frame":
+            self._fill_shared_slots(_slots, _values)
+            return pd.DataFrame(
+                _values, index=self.dataframe.index, columns=self._frame_columns()
+            )
+
+        for _column_key, _column_plan in self.plan.items():
+            _features = _values[:, _slots[_column_key]]
+            self.output_dict[_column_key] = {
+                "weighted_window_features": {
+                    _window_key: pd.DataFrame(
+                        _features[:, _positions], index=self.dataframe.index
+                    )
+                    for _window_key, _positions in _column_plan["outputs"].items()
+                }
+            }
         return self.output_dict
 
 
@@ -18,6 +18,17 @@ from NitroFE.time_based_features.weighted_window_features.weighted_windows impor
     _triang_window,
     _weighted_moving_window,
 )
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _accepts_axis,
+    _frame_like,
+    _is_linear_operation,
+    _float_values,
+    _weighted_rolling_linear,
+    _weighted_rolling_reduce,
+    _window_kernels,
+    _RingBuffer,
+    _validate_fit,
+)
 
 import numpy as np
 import pandas as pd
@@ -37,6 +48,72 @@ class weighted_window_features:
         for _key in kwargs.keys():
             self.params[function_name][_key] = kwargs[_key]
 
+    def _array_feature_calculation(
+        self, function_name, win_function, values, first_row=0
+    ):
+        """
+        Vectorized rolling calculation over a (n_rows, n_cols) float array, rows before first_row
+        only serve as history. Returns None when the operation or the data needs the rolling().agg path.
+        Sum/mean skip missing values, other operations fall back to rolling().agg for the columns
+        holding missing values only.
+        """
+        _params = self.params[function_name]
+        _kernels = _params["kernels"]
+        if (_kernels is None) or (values is None):
+            return None
+
+        _window = _params["window"]
+        _min_periods = (
+            _window if _params["min_periods"] is None else _params["min_periods"]
+        )
+        _operation = _params["operation"]
+        if _params["linear"]:
+            return _weighted_rolling_linear(
+                values,
+                window=_window,
+                min_periods=_min_periods,
+                kernels=_kernels,
+                mean=_operation is np.mean,
+                first_row=first_row,
+            )
+
+        _missing = np.isnan(values).any(axis=0)
+        _return = np.empty((len(values) - first_row, values.shape[1]))
+        if not _missing.all():
+            _reduced = _weighted_rolling_reduce(
+                values[:, ~_missing],
+                window=_window,
+                min_periods=_min_periods,
+                kernels=_kernels,
+                operation=_operation,
+                operation_args=_params["operation_args"],
+                first_row=first_row,
+            )
+            if _reduced is None:
+                return None
+            _return[:, ~_missing] = _reduced
+        if _missing.any():
+            _return[:, _missing] = self._rolling_feature_calculation(
+                function_name, win_function, pd.DataFrame(values[:, _missing])
+            ).to_numpy(dtype=float)[first_row:]
+        return _return
+
+    def _rolling_feature_calculation(self, function_name, win_function, dataframe):
+        return dataframe.rolling(
+            window=self.params[function_name]["window"],
+            min_periods=self.params[function_name]["min_periods"],
+        ).agg(
+            lambda x: self.params[function_name]["operation"](
+                win_function(
+                    data=x,
+                    window_size=self.params[function_name]["window"],
+                    symmetric=self.params[function_name]["symmetric"],
+                    **self.params[function_name]["kwargs"]
+                ),
+                *self.params[function_name]["operation_args"]
+            )
+        )
+
     def _template_feature_calculation(
         self,
         function_name,
@@ -70,57 +147,76 @@ class weighted_window_features:
 
             self.first_fit_params_save(_function_name, kwargs=kwargs)
 
-        if not first_fit:
-            if (
-                self.params[_function_name]["last_values_from_previous_run"] is None
-            ) and (self.params[_function_name]["window"] != 1):
-                raise ValueError(
-                    "First fit has not occured before. Kindly run first_fit=True for first fit instance,"
-                    "and then proceed with first_fit=False for subsequent fits "
+            _validate_fit(
+                first_fit, dataframe=dataframe, rolling=[(window, min_periods)]
+            )
+
+            # dispatch decision and window kernels, None when only rolling().agg can compute
+            _linear = _is_linear_operation(operation, operation_args)
+            self.params[_function_name]["linear"] = _linear
+            self.params[_function_name]["kernels"] = (
+                _window_kernels(win_function, window, symmetric, kwargs)
+                if _linear or _accepts_axis(operation, operation_args)
+                else None
+            )
+
+            _values = _float_values(dataframe)
+            _return_values = self._array_feature_calculation(
+                _function_name, win_function, _values
+            )
+            if _return_values is None:
+                _return = self._rolling_feature_calculation(
+                    _function_name, win_function, dataframe
                 )
-            dataframe = pd.concat(
-                [
-                    self.params[_function_name]["last_values_from_previous_run"],
-                    dataframe,
-                ],
-                axis=0,
+            else:
+                _return = _frame_like(_return_values, dataframe)
+
+            _last_values_from_previous_run = _RingBuffer(
+                size=self.params[_function_name]["window"] - 1,
+                n_cols=_values.shape[1],
             )
 
-        _return = dataframe.rolling(
-            window=self.params[_function_name]["window"],
-            min_periods=self.params[_function_name]["min_periods"],
-        ).agg(
-            lambda x: self.params[_function_name]["operation"](
-                win_function(
-                    data=x,
-                    window_size=self.params[_function_name]["window"],
-                    symmetric=self.params[_function_name]["symmetric"],
-                    **self.params[_function_name]["kwargs"]
-                ),
-                *self.params[_function_name]["operation_args"]
+        else:
+            _validate_fit(
+                first_fit,
+                self.params.get(_function_name, {}).get("last_values_from_previous_run")
+                is not None,
             )
-        )
-        if not first_fit:
-            _return = _return.iloc[
-                self.params[_function_name]["len_last_values_from_previous_run"] :
+            _last_values_from_previous_run = self.params[_function_name][
+                "last_values_from_previous_run"
             ]
+            _previous_values = _last_values_from_previous_run.values()
+
+            _values = dataframe.to_numpy(dtype=float).reshape(len(dataframe), -1)
+            _all_values = np.concatenate((_previous_values, _values))
+            _return_values = self._array_feature_calculation(
+                _function_name,
+                win_function,
+                _all_values,
+                first_row=len(_previous_values),
+            )
+            if _return_values is None:
+                _return = self._rolling_feature_calculation(
+                    _function_name,
+                    win_function,
+                    _frame_like(
+                        _all_values, dataframe, index=pd.RangeIndex(len(_all_values))
+                    ),
+                ).iloc[len(_previous_values) :]
+                _return.index = dataframe.index
+            else:
+                _return = _frame_like(_return_values, dataframe)
 
         if not self.params[_function_name]["last_values_from_calculated"]:
-            _last_values_from_previous_run = (
-                dataframe.iloc[1 - self.params[_function_name]["window"] :]
-                if self.params[_function_name]["window"] != 1
-                else None
-            )
+            _last_values_from_previous_run.extend(_values)
         else:
-            _last_values_from_previous_run = (
-                _return.iloc[1 - self.params[_function_name]["window"] :]
-                if self.params[_function_name]["window"] != 1
-                else None
-            )
+            # only the outputs of this call are carried, earlier ones are dropped
+            _calculated = _return.to_numpy(dtype=float).reshape(len(_return), -1)
+            _last_values_from_previous_run.clear()
+            _last_values_from_previous_run.extend(_calculated)
         self.first_fit_params_save(
             _function_name,
             last_values_from_previous_run=_last_values_from_previous_run,
-            len_last_values_from_previous_run=len(_last_values_from_previous_run),
         )
 
         return _return
@@ -0,0 +1,627 @@
+from scipy import fft, signal
+from numpy.lib.stride_tricks import sliding_window_view
+import inspect
+import numpy as np
+import pandas as pd
+
+_DIRECT_CONVOLUTION_MAX_WINDOW = 64
+_BATCH_ELEMENTS = 1 << 22
+
+
+def _float_values(dataframe):
+    """
+    (n_rows, n_cols) float array of the values of a dataframe/series,
+    None when they can not be represented as floats.
+    """
+    try:
+        values = np.ascontiguousarray(dataframe.to_numpy(dtype=float))
+    except (TypeError, ValueError):
+        return None
+    return values if values.ndim == 2 else values[:, None]
+
+
+def _frame_like(values, dataframe, index=None):
+    index = dataframe.index if index is None else index
+    if isinstance(dataframe, pd.Series):
+        return pd.Series(values[:, 0], index=index, name=dataframe.name)
+    return pd.DataFrame(values, index=index, columns=dataframe.columns)
+
+
+def _validate_fit(first_fit, fitted=True, dataframe=None, rolling=(), ewm=()):
+    """
+    Checks a fit call before any state is set.
+
+    On a first fit, raises the errors that dataframe.rolling(window=..., min_periods=...) and
+    dataframe.ewm(**kwargs) raise for invalid arguments, for every (window, min_periods) pair
+    of 'rolling' and every keyword dict of 'ewm'. On later fits, raises when 'fitted' is False.
+
+    Parameters
+    ----------
+    first_fit : bool
+        first_fit argument of the fit
+    fitted : bool, optional
+        whether the state of a first fit is there, by default True
+    dataframe : Union[pd.DataFrame, pd.Series], optional
+        data the feature is fitted on, an empty series when None, by default None
+    rolling : iterable, optional
+        (window, min_periods) pairs of the rolling windows, by default ()
+    ewm : iterable, optional
+        keyword dicts of the exponential moving windows, by default ()
+    """
+    if not first_fit:
+        if not fitted:
+            raise ValueError(
+                "First fit has not occured before. Kindly run first_fit=True for first fit instance,"
+                "and then proceed with first_fit=False for subsequent fits "
+            )
+        return
+
+    _data = pd.Series(dtype=float) if dataframe is None else dataframe
+    for _window, _min_periods in rolling:
+        _data.rolling(window=_window, min_periods=_min_periods)
+    for _kwargs in ewm:
+        _data.ewm(**_kwargs)
+
+
+def _is_linear_operation(operation, operation_args):
+    return (operation_args == ()) and (operation is np.sum or operation is np.mean)
+
+
+def _accepts_axis(operation, operation_args):
+    # only numpy functions are known to reduce plain arrays, pandas methods such as
+    # pd.Series.std also bind an axis but need a Series
+    if str(getattr(operation, "__module__", None)).split(".")[0] != "numpy":
+        return False
+    try:
+        inspect.signature(operation).bind(None, *operation_args, axis=-1)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _window_kernels(win_function, window, symmetric, kwargs):
+    """
+    Weight vectors which win_function applies to a window of length 1..window,
+    obtained by weighting a vector of ones.
+    """
+    return [
+        np.asarray(
+            win_function(
+                data=np.ones(_length), window_size=window, symmetric=symmetric, **kwargs
+            ),
+            dtype=float,
+        )
+        for _length in range(1, window + 1)
+    ]
+
+
+def _linear_warm_up(values, window, min_periods, kernels, mean, out, first_row=0):
+    for _row in range(first_row, min(window - 1, len(values))):
+        if _row + 1 >= min_periods:
+            out[_row - first_row] = kernels[_row] @ values[: _row + 1]
+            if mean:
+                out[_row - first_row] /= _row + 1
+
+
+def _weighted_rolling_linear(
+    values, window, min_periods, kernels, mean=False, first_row=0
+):
+    """
+    Weighted rolling sum/mean of the columns of a 2-D float array.
+
+    Row i is reduced over the last min(i+1, window) values with the matching kernel,
+    exactly like rolling().agg over a _*_window function. Full windows of all columns are
+    computed at once, as a matrix product of the sliding windows with the kernel, a convolution
+    for a single column, or an overlap-add FFT convolution for long kernels.
+    Missing values are skipped, like the pandas sum and mean of a window: they are zero filled
+    and means are taken over the values present in the window.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    min_periods : int
+        Minimum number of observations in window required to have a value
+    kernels : list
+        kernels[k-1] is the weight vector applied to a window holding k values
+    mean : bool, optional
+        If True, weighted sums are divided by the number of values in the window, by default False
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    """
+    _missing = np.isnan(values)
+    if _missing.any():
+        _return = _weighted_rolling_linear(
+            np.where(_missing, 0.0, values), window, 0, kernels, first_row=first_row
+        )
+        _counts = _rolling_count(values, window)[first_row:]
+        if mean:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                _return /= _counts
+        _return[_counts < min_periods] = np.nan
+        return _return
+
+    n_rows, n_cols = values.shape
+    _return = np.full((n_rows - first_row, n_cols), np.nan)
+
+    _linear_warm_up(values, window, min_periods, kernels, mean, _return, first_row)
+
+    _full_start = max(window - 1, first_row)
+    if n_rows > _full_start:
+        _values = values[_full_start - window + 1 :]
+        _full = _return[_full_start - first_row :]
+        if window > _DIRECT_CONVOLUTION_MAX_WINDOW:
+            _full[:] = signal.oaconvolve(
+                _values, kernels[window - 1][::-1, None], mode="valid", axes=0
+            )
+        elif n_cols == 1:
+            _full[:, 0] = np.convolve(
+                _values[:, 0], kernels[window - 1][::-1], mode="valid"
+            )
+        else:
+            _windows = sliding_window_view(_values, window, axis=0)
+            _step = max(1, _BATCH_ELEMENTS // max(1, n_cols * window))
+            for _start in range(0, len(_windows), _step):
+                _full[_start : _start + _step] = (
+                    _windows[_start : _start + _step] @ kernels[window - 1]
+                )
+        if mean:
+            _full /= window
+
+    return _return
+
+
+def _weighted_rolling_linear_bank(values, specs):
+    """
+    Weighted rolling sum/mean of a single float column for many window specifications at once.
+
+    Equally weighted specifications share one prefix sum of the column. The remaining specifications
+    with windows long enough for FFT convolution share one FFT of the column, shorter ones
+    are convolved directly. Results match _weighted_rolling_linear for every specification.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1-D float array without missing values
+    specs : list
+        (window, min_periods, kernels, mean) tuples, as passed to _weighted_rolling_linear
+
+    Returns
+    -------
+    np.ndarray
+        (n_rows, n_specs) array, one column per specification
+    """
+    n_rows = len(values)
+    _return = np.full((n_rows, len(specs)), np.nan)
+
+    _equal = [all((_kernel == 1).all() for _kernel in _spec[2]) for _spec in specs]
+    if any(_equal):
+        # prefix sums of the centered column keep the window differences well conditioned
+        _offset = values.mean() if n_rows else 0.0
+        _prefix = np.concatenate(([0.0], np.cumsum(values - _offset)))
+
+    _fft_windows = [
+        _spec[0]
+        for _spec, _is_equal in zip(specs, _equal)
+        if (not _is_equal) and (_spec[0] > _DIRECT_CONVOLUTION_MAX_WINDOW)
+    ]
+    if _fft_windows:
+        _fft_length = fft.next_fast_len(n_rows + max(_fft_windows) - 1, real=True)
+        _spectrum = fft.rfft(values, _fft_length)
+
+    for _col, (window, min_periods, kernels, mean) in enumerate(specs):
+        _out = _return[:, _col]
+        if _equal[_col]:
+            _counts = np.minimum(np.arange(1, n_rows + 1), window)
+            _sums = (
+                _prefix[1:]
+                - _prefix[np.arange(1, n_rows + 1) - _counts]
+                + _offset * _counts
+            )
+            _out[:] = _sums / _counts if mean else _sums
+            _out[_counts < min_periods] = np.nan
+        elif window > _DIRECT_CONVOLUTION_MAX_WINDOW:
+            _linear_warm_up(
+                values[:, None], window, min_periods, kernels, mean, _out[:, None]
+            )
+            if n_rows >= window:
+                _full = fft.irfft(
+                    _spectrum * fft.rfft(kernels[window - 1][::-1], _fft_length),
+                    _fft_length,
+                )[window - 1 : n_rows]
+                _out[window - 1 :] = _full / window if mean else _full
+        else:
+            _out[:] = _weighted_rolling_linear(
+                values[:, None], window, min_periods, kernels, mean
+            )[:, 0]
+
+    return _return
+
+
+def _weighted_rolling_reduce(
+    values, window, min_periods, kernels, operation, operation_args, first_row=0
+):
+    """
+    Weighted rolling reduction of the columns of a 2-D float array, for operations
+    accepting an axis argument.
+
+    Full windows are taken from a zero-copy sliding_window_view, weighted in one broadcast
+    and reduced along the last axis, a bounded block of rows at a time.
+    Returns None when operation does not reduce each window to a single value.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array without missing values
+    window : int
+        Size of the rolling window
+    min_periods : int
+        Minimum number of observations in window required to have a value
+    kernels : list
+        kernels[k-1] is the weight vector applied to a window holding k values
+    operation : Callable
+        reduction called as operation(weighted_windows, *operation_args, axis=-1)
+    operation_args : tuple
+        additional agrument values to be sent for operation function
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    """
+    n_rows, n_cols = values.shape
+    _return = np.full((n_rows - first_row, n_cols), np.nan)
+
+    for _row in range(first_row, min(window - 1, n_rows)):
+        if _row + 1 >= min_periods:
+            _reduced = operation(
+                kernels[_row] * values[: _row + 1].T, *operation_args, axis=-1
+            )
+            if np.shape(_reduced) != (n_cols,):
+                return None
+            _return[_row - first_row] = _reduced
+
+    _full_start = max(window - 1, first_row)
+    if n_rows > _full_start:
+        _windows = sliding_window_view(
+            values[_full_start - window + 1 :], window, axis=0
+        )
+        _full = _return[_full_start - first_row :]
+        _step = max(1, _BATCH_ELEMENTS // max(1, n_cols * window))
+        for _start in range(0, len(_windows), _step):
+            _block = _windows[_start : _start + _step]
+            _reduced = operation(_block * kernels[window - 1], *operation_args, axis=-1)
+            if np.shape(_reduced) != _block.shape[:2]:
+                return None
+            _full[_start : _start + len(_block)] = _reduced
+
+    return _return
+
+
+def _block_running_maxima(values, window):
+    """
+    Running maxima of consecutive blocks of 'window' rows, from the start (prefix) and from the
+    end (suffix) of each block, with the row of their earliest occurrence.
+    Missing values are taken as -inf.
+    """
+    n_rows, n_cols = values.shape
+    n_blocks = -(-n_rows // window)
+    _padded = np.full((n_blocks * window, n_cols), -np.inf)
+    _padded[:n_rows] = np.where(np.isnan(values), -np.inf, values)
+    _blocks = _padded.reshape(n_blocks, window, n_cols)
+    _rows = np.arange(n_blocks * window).reshape(n_blocks, window, 1)
+
+    _prefix = np.maximum.accumulate(_blocks, axis=1)
+    _records = np.ones(_blocks.shape, dtype=bool)
+    _records[:, 1:] = _blocks[:, 1:] > _prefix[:, :-1]
+    _prefix_rows = np.maximum.accumulate(np.where(_records, _rows, -1), axis=1)
+
+    _suffix = np.maximum.accumulate(_blocks[:, ::-1], axis=1)[:, ::-1]
+    _records[:] = True
+    _records[:, :-1] = _blocks[:, :-1] >= _suffix[:, 1:]
+    _suffix_rows = np.minimum.accumulate(
+        np.where(_records, _rows, n_blocks * window)[:, ::-1], axis=1
+    )[:, ::-1]
+
+    return (
+        _prefix.reshape(-1, n_cols),
+        _prefix_rows.reshape(-1, n_cols),
+        _suffix.reshape(-1, n_cols),
+        _suffix_rows.reshape(-1, n_cols),
+    )
+
+
+def _rolling_argmax(values, window, first_row=0):
+    # rows before the first window of the result are never reached
+    _skipped = max(first_row - window + 1, 0)
+    values, first_row = values[_skipped:], first_row - _skipped
+    n_rows, n_cols = values.shape
+    _ends = np.arange(first_row, n_rows)
+    _starts = np.maximum(_ends - window + 1, 0)
+
+    if 0 < n_rows - first_row < window:
+        # a few rows, as for incremental fits, are cheaper to reduce window by window
+        _padding = window - 1 - first_row
+        _filled = np.full((_padding + n_rows, n_cols), -np.inf)
+        _filled[_padding:] = np.where(np.isnan(values), -np.inf, values)
+        _windows = sliding_window_view(_filled, window, axis=0)
+        _positions = _windows.argmax(axis=-1)
+        _maxima = np.take_along_axis(_windows, _positions[..., None], axis=-1)[..., 0]
+        return _maxima, _positions + (_ends - window + 1 - _starts)[:, None]
+
+    _prefix, _prefix_rows, _suffix, _suffix_rows = _block_running_maxima(values, window)
+
+    # a full window ending at row i is the suffix of the block of its first row
+    # followed by the prefix of the block of row i, ties go to the earlier row
+    _from_suffix = (_ends >= window - 1)[:, None] & (_suffix[_starts] >= _prefix[_ends])
+    _maxima = np.where(_from_suffix, _suffix[_starts], _prefix[_ends])
+    _positions = np.where(_from_suffix, _suffix_rows[_starts], _prefix_rows[_ends])
+    return _maxima, _positions - _starts[:, None]
+
+
+def _rolling_extrema(values, window, first_row=0):
+    """
+    Rolling maximum and minimum of the columns of a 2-D float array over the last
+    min(i+1, window) rows, with their positions in the window.
+
+    Runs in O(n_rows) vectorized passes over all columns with the van Herk/Gil-Werman scheme:
+    the rows are split in blocks of 'window' rows, every window is the suffix of one block and
+    the prefix of the next. Missing values are skipped, windows without any value give NaN
+    and position -1, and ties resolve to the earliest row, like Series.argmax/argmin.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+
+    Returns
+    -------
+    tuple
+        (maxima, minima, argmax, argmin), (n_rows - first_row, n_cols) float arrays of the
+        extrema and int arrays of their positions from the first row of the window
+    """
+    # rows before the first window of the result are never reached
+    _skipped = max(first_row - window + 1, 0)
+    values, first_row = values[_skipped:], first_row - _skipped
+
+    _maxima, _argmax = _rolling_argmax(values, window, first_row)
+    _minima, _argmin = _rolling_argmax(-values, window, first_row)
+    _minima = -_minima
+
+    _empty = _rolling_count(values, window)[first_row:] == 0
+    _maxima[_empty] = np.nan
+    _minima[_empty] = np.nan
+    _argmax[_empty] = -1
+    _argmin[_empty] = -1
+    return _maxima, _minima, _argmax, _argmin
+
+
+def _rolling_moments(values, window, first_row=0, squares=True):
+    """
+    Count, center, sum and sum of squares of the deviations from the center, of the values
+    of the columns of a 2-D float array over the last min(i+1, window) rows, in O(n_rows)
+    vectorized passes over all columns.
+
+    The rows are split in blocks of 'window' rows and the count, sum and sum of squares of every
+    block are accumulated from its start and from its end, around the mean of the block.
+    Every window joins the end of one block to the start of the next, the partial moments being
+    shifted to a common center as in Welford's parallel update, so sums stay at the scale of a
+    window and long series do not lose precision. Missing values are skipped.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    squares : bool, optional
+        If False, the sums of squares are not computed and None is returned, by default True
+
+    Returns
+    -------
+    tuple
+        (count, center, sum, squares), (n_rows - first_row, n_cols) float arrays
+    """
+    n_rows, n_cols = values.shape
+    n_blocks = -(-n_rows // window)
+    _padded = np.full((n_blocks * window, n_cols), np.nan)
+    _padded[:n_rows] = values
+    _blocks = _padded.reshape(n_blocks, window, n_cols)
+
+    _observed = ~np.isnan(_blocks)
+    _block_counts = _observed.sum(axis=1)
+    _centers = np.where(_observed, _blocks, 0).sum(axis=1) / np.maximum(
+        _block_counts, 1
+    )
+    # blocks without values take the center of the closest earlier (else later) block
+    _block_rows = np.arange(n_blocks)[:, None]
+    _earlier = np.maximum.accumulate(np.where(_block_counts > 0, _block_rows, -1))
+    _later = np.minimum.accumulate(
+        np.where(_block_counts > 0, _block_rows, n_blocks)[::-1]
+    )[::-1]
+    _nearest = np.where(_earlier >= 0, _earlier, np.minimum(_later, n_blocks - 1))
+    _centers = np.take_along_axis(_centers, _nearest, axis=0)
+    _deviations = np.where(_observed, _blocks - _centers[:, None, :], 0)
+
+    def _running(_moments, _reverse):
+        _moments = _moments[:, ::-1] if _reverse else _moments
+        _running_moments = np.cumsum(_moments, axis=1)
+        _running_moments = _running_moments[:, ::-1] if _reverse else _running_moments
+        return _running_moments.reshape(-1, n_cols)
+
+    _ends = np.arange(first_row, n_rows)
+    _starts = np.maximum(_ends - window + 1, 0)
+    _from_suffix = ((_ends >= window - 1) & (_starts % window != 0))[:, None]
+    _row_centers = np.repeat(_centers, window, axis=0)
+    _center = _row_centers[_ends]
+    _shift = _row_centers[_starts] - _center
+
+    _suffix_count = np.where(_from_suffix, _running(_observed, True)[_starts], 0)
+    _suffix_sum = np.where(_from_suffix, _running(_deviations, True)[_starts], 0)
+    _count = _suffix_count + _running(_observed, False)[_ends]
+    _sum = _suffix_sum + _suffix_count * _shift + _running(_deviations, False)[_ends]
+    if not squares:
+        return _count, _center, _sum, None
+
+    _suffix_squares = np.where(
+        _from_suffix, _running(_deviations * _deviations, True)[_starts], 0
+    )
+    _squares = (
+        _suffix_squares
+        + 2 * _shift * _suffix_sum
+        + _suffix_count * _shift * _shift
+        + _running(_deviations * _deviations, False)[_ends]
+    )
+    return _count, _center, _sum, _squares
+
+
+def _rolling_mean(values, window, min_periods, first_row=0):
+    """
+    Rolling mean of the columns of a 2-D float array over the last min(i+1, window) rows,
+    missing values are skipped like Series.mean
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    min_periods : int
+        Minimum number of observations in window required to have a value
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    """
+    _count, _center, _sum, _ = _rolling_moments(
+        values, window, first_row, squares=False
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _mean = _center + _sum / _count
+    _mean[(_count < min_periods) | (_count == 0)] = np.nan
+    return _mean
+
+
+def _rolling_mean_std(values, window, min_periods, first_row=0, ddof=0):
+    """
+    Rolling mean and standard deviation of the columns of a 2-D float array over the last
+    min(i+1, window) rows, from the moments of _rolling_moments. Missing values are skipped
+    like Series.mean/std, windows without spread have an exact zero deviation.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    window : int
+        Size of the rolling window
+    min_periods : int
+        Minimum number of observations in window required to have a value
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+    ddof : int, optional
+        Delta degrees of freedom of the standard deviation, by default 0
+
+    Returns
+    -------
+    tuple
+        (mean, std), two (n_rows - first_row, n_cols) float arrays
+    """
+    _count, _center, _sum, _squares = _rolling_moments(values, window, first_row)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _mean = _center + _sum / _count
+        _variance = np.maximum(_squares - _sum * _sum / _count, 0) / (_count - ddof)
+    _variance[_count <= ddof] = np.nan
+
+    _maxima, _minima, _, _ = _rolling_extrema(values, window, first_row)
+    _variance[_maxima == _minima] = 0
+
+    _few = (_count < min_periods) | (_count == 0)
+    _mean[_few] = np.nan
+    _variance[_few] = np.nan
+    return _mean, np.sqrt(_variance)
+
+
+def _rolling_count(values, window):
+    """
+    Number of non missing values of the columns of a 2-D float array over the last
+    min(i+1, window) rows
+    """
+    _valid = np.zeros((len(values) + 1, values.shape[1]))
+    np.cumsum(~np.isnan(values), axis=0, out=_valid[1:])
+    _starts = np.maximum(np.arange(1, len(values) + 1) - window, 0)
+    return _valid[1:] - _valid[_starts]
+
+
+def _lagged_values(values, lag, first_row=0):
+    """
+    Values of the columns of a 2-D float array and their values 'lag' rows earlier, for the rows
+    from first_row. Rows whose last lag + 1 values are not all observed are missing in both,
+    like a rolling window of lag + 1 rows with min_periods left to None.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+    lag : int
+        Number of rows to look back
+    first_row : int, optional
+        rows before first_row only serve as history and are left out of the result, by default 0
+
+    Returns
+    -------
+    tuple
+        (current, lagged), two (n_rows - first_row, n_cols) float arrays
+    """
+    _current = values[first_row:].copy()
+    _lagged = np.full(_current.shape, np.nan)
+    _rows = np.arange(first_row, len(values)) - lag
+    _lagged[_rows >= 0] = values[_rows[_rows >= 0]]
+
+    _incomplete = _rolling_count(values, lag + 1)[first_row:] < lag + 1
+    _current[_incomplete] = np.nan
+    _lagged[_incomplete] = np.nan
+    return _current, _lagged
+
+
+class _RingBuffer:
+    """
+    Preallocated buffer holding the last 'size' rows of a (n_rows, n_cols) float array
+    """
+
+    def __init__(self, size: int, n_cols: int):
+        self.size = size
+        self._buffer = np.empty((size, n_cols))
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._start = 0
+        self._count = 0
+
+    def extend(self, values: np.ndarray):
+        if self.size == 0:
+            return
+        values = values[-self.size :]
+        _write = (self._start + self._count) % self.size
+        _first = min(len(values), self.size - _write)
+        self._buffer[_write : _write + _first] = values[:_first]
+        self._buffer[: len(values) - _first] = values[_first:]
+
+        _overflow = max(0, self._count + len(values) - self.size)
+        self._start = (self._start + _overflow) % self.size
+        self._count = min(self.size, self._count + len(values))
+
+    def values(self):
+        _end = self._start + self._count
+        if _end <= self.size:
+            return self._buffer[self._start : _end]
+        return np.concatenate(
+            (self._buffer[self._start :], self._buffer[: _end - self.size])
+        )
@@ -1,5 +1,35 @@
 from scipy import signal
 import numpy as np
+from functools import lru_cache
+
+_WINDOW_COEFFICIENTS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_WINDOW_COEFFICIENTS_CACHE_SIZE)
+def _cached_window_coefficients(window_kind, window_size, sym, window_kwargs):
+    if window_kind == "weighted_moving":
+        window_function_values = np.arange(1, window_size + 1) / np.arange(
+            1, window_size + 1
+        ).sum()
+    elif window_kind == "equal":
+        window_function_values = np.ones(window_size)
+    else:
+        window_function_values = getattr(signal.windows, window_kind)(
+            window_size, sym=sym, **dict(window_kwargs)
+        )
+    window_function_values.setflags(write=False)
+    return window_function_values
+
+
+def _window_coefficients(window_kind, window_size, sym=True, **kwargs):
+    """
+    Coefficient vector of a window function, built once per
+    (window kind, length, symmetric, extra kwargs) and then served from a bounded LRU cache.
+    The returned array is shared between callers and is read-only.
+    """
+    return _cached_window_coefficients(
+        window_kind, int(window_size), sym, tuple(sorted(kwargs.items()))
+    )
 
 
 def _weighted_window_operation(data,
@@ -21,9 +51,9 @@ def _barthann_window(data,
 
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.barthann(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("barthann", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.barthann(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("barthann", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)   
 
  
@@ -33,9 +63,9 @@ def _weighted_moving_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=np.arange(1,window_size+1)/np.arange(1,window_size+1).sum()
+        window_function_values=_window_coefficients("weighted_moving", window_size)
     else:
-        window_function_values=np.arange(1,len(data)+1)/np.arange(1,len(data)+1).sum()
+        window_function_values=_window_coefficients("weighted_moving", len(data))
     return np.multiply(window_function_values, data)  
 
 
@@ -45,9 +75,9 @@ def _bartlett_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.bartlett(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("bartlett", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.bartlett(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("bartlett", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)   
 
 
@@ -57,9 +87,9 @@ def _blackman_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.blackman(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("blackman", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.blackman(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("blackman", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)  
 
 
@@ -69,9 +99,9 @@ def _blackmanharris_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.blackmanharris(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("blackmanharris", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.blackmanharris(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("blackmanharris", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -81,9 +111,9 @@ def _bohman_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.bohman(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("bohman", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.bohman(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("bohman", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -93,9 +123,9 @@ def _cosine_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.cosine(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("cosine", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.cosine(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("cosine", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -107,10 +137,10 @@ def _exponential_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.exponential(window_size, center=center,
+        window_function_values=_window_coefficients("exponential", window_size, center=center,
                                       tau=tau, sym=symmetric)
     else:
-        window_function_values=signal.windows.exponential(len(data), center=center,
+        window_function_values=_window_coefficients("exponential", len(data), center=center,
                                       tau=tau, sym=symmetric)
     return np.multiply(window_function_values, data)
 
@@ -122,9 +152,9 @@ def _flattop_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.flattop(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("flattop", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.flattop(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("flattop", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -135,9 +165,9 @@ def _gaussian_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.gaussian(window_size, std=std,sym=symmetric)
+        window_function_values=_window_coefficients("gaussian", window_size, std=std,sym=symmetric)
     else:
-        window_function_values=signal.windows.gaussian(len(data), std=std,sym=symmetric)
+        window_function_values=_window_coefficients("gaussian", len(data), std=std,sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -147,9 +177,9 @@ def _hamming_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.hamming(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("hamming", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.hamming(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("hamming", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -159,9 +189,9 @@ def _hann_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.hamming(window_size, sym=symmetric)
+        window_function_values=_window_coefficients("hamming", window_size, sym=symmetric)
     else:
-        window_function_values=signal.windows.hamming(len(data), sym=symmetric)
+        window_function_values=_window_coefficients("hamming", len(data), sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -172,9 +202,9 @@ def _kaiser_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.kaiser(window_size, beta,sym=symmetric)
+        window_function_values=_window_coefficients("kaiser", window_size, beta=beta,sym=symmetric)
     else:
-        window_function_values=signal.windows.kaiser(len(data), beta,sym=symmetric)
+        window_function_values=_window_coefficients("kaiser", len(data), beta=beta,sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -184,9 +214,9 @@ def _parzen_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.parzen(window_size,sym=symmetric)
+        window_function_values=_window_coefficients("parzen", window_size,sym=symmetric)
     else:
-        window_function_values=signal.windows.parzen(len(data),sym=symmetric)
+        window_function_values=_window_coefficients("parzen", len(data),sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -196,9 +226,9 @@ def _triang_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=signal.windows.triang(window_size,sym=symmetric)
+        window_function_values=_window_coefficients("triang", window_size,sym=symmetric)
     else:
-        window_function_values=signal.windows.triang(len(data),sym=symmetric)
+        window_function_values=_window_coefficients("triang", len(data),sym=symmetric)
     return np.multiply(window_function_values, data)
 
 
@@ -208,9 +238,9 @@ def _equal_window(data,
                   resize=False):
     if (len(data) < window_size)&(resize):
         data = np.concatenate((np.zeros(window_size-len(data)), data))
-        window_function_values=np.ones(window_size)
+        window_function_values=_window_coefficients("equal", window_size)
     else:
-        window_function_values=np.ones(len(data))
+        window_function_values=_window_coefficients("equal", len(data))
     return np.multiply(window_function_values, data)
 
 def _identity_window(data,
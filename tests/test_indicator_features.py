@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from NitroFE import AverageTrueRange
+from NitroFE.time_based_features.indicator_features._ElasticSeriesWeightedAverage import (
+    ElasticSeriesWeightedAverage,
+)
+
+
+def _random_walk(n_rows=40, seed=3):
+    return pd.DataFrame(
+        np.random.RandomState(seed).randn(n_rows, 2).cumsum(axis=0) + 50,
+        columns=["a", "b"],
+    )
+
+
+def _true_range(x):
+    return max(x.max() - x.min(), abs(x.max() - x[-1]), abs(x.min() - x[-1]))
+
+
+@pytest.mark.parametrize(
+    "true_range_min_periods, average_true_range_periods", [(None, 1), (2, 3), (1, None)]
+)
+def test_average_true_range_matches_rolling_reference(
+    true_range_min_periods, average_true_range_periods
+):
+    frame = _random_walk()
+    true_range = frame.rolling(4, min_periods=true_range_min_periods).apply(
+        _true_range, raw=True
+    )
+    expected = true_range.rolling(4, min_periods=average_true_range_periods).mean()
+
+    feature = AverageTrueRange(
+        true_range_lookback=4,
+        true_range_min_periods=true_range_min_periods,
+        average_true_range_periods=average_true_range_periods,
+    )
+    result = pd.concat(
+        [
+            feature.fit(frame.iloc[:12]),
+            feature.fit(frame.iloc[12:13], first_fit=False),
+            feature.fit(frame.iloc[13:], first_fit=False),
+        ]
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_elastic_series_weighted_average_matches_recursion():
+    frame = _random_walk()
+    weights = pd.DataFrame(
+        np.random.RandomState(4).rand(40, 2) + 0.1, columns=["a", "b"]
+    )
+    weight_sums = weights.rolling(4, min_periods=1).sum().to_numpy()
+
+    # row by row recursion of the original implementation
+    expected = np.empty(frame.shape)
+    previous = frame.to_numpy()[0]
+    for row in range(len(frame)):
+        previous = previous + (frame.to_numpy()[row] - previous) * (
+            weights.to_numpy()[row] / weight_sums[row]
+        )
+        expected[row] = previous
+
+    feature = ElasticSeriesWeightedAverage(weight_sum_lookback=4)
+    result = pd.concat(
+        [
+            feature.fit(frame.iloc[:12], weights.iloc[:12]),
+            feature.fit(frame.iloc[12:13], weights.iloc[12:13], first_fit=False),
+            feature.fit(frame.iloc[13:], weights.iloc[13:], first_fit=False),
+        ]
+    )
+
+    pd.testing.assert_frame_equal(
+        result, pd.DataFrame(expected, index=frame.index, columns=frame.columns)
+    )
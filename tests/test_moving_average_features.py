@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from NitroFE import (
+    ExponentialMovingFeature,
+    FractalAdaptiveMovingAverage,
+    KaufmanAdaptiveMovingAverage,
+    SmoothedMovingAverage,
+    TripleExponentialMovingFeature,
+)
+
+
+def _frame_with_gaps():
+    frame = pd.DataFrame(
+        np.random.RandomState(0).randn(60, 3).cumsum(axis=0), columns=["a", "b", "c"]
+    )
+    frame.iloc[:4, 0] = np.nan
+    frame.iloc[20:27, 0] = np.nan
+    frame.iloc[[9, 10, 41, 59], 1] = np.nan
+    frame["c"] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize("ignore_na", [False, True])
+@pytest.mark.parametrize("operation", ["mean", "var", "std"])
+def test_exponential_moving_feature_split_fits_match_full_fit(operation, ignore_na):
+    frame = _frame_with_gaps()
+    expected = getattr(
+        frame.ewm(span=5, min_periods=3, adjust=False, ignore_na=ignore_na), operation
+    )()
+
+    full = ExponentialMovingFeature(
+        span=5, operation=operation, min_periods=3, ignore_na=ignore_na
+    ).fit(frame)
+    feature = ExponentialMovingFeature(
+        span=5, operation=operation, min_periods=3, ignore_na=ignore_na
+    )
+    split = pd.concat(
+        [
+            feature.fit(frame.iloc[:2]),
+            feature.fit(frame.iloc[2:22], first_fit=False),
+            feature.fit(frame.iloc[22:23], first_fit=False),
+            feature.fit(frame.iloc[23:], first_fit=False),
+        ]
+    )
+
+    pd.testing.assert_frame_equal(full, expected)
+    pd.testing.assert_frame_equal(split, full)
+
+
+def test_triple_exponential_moving_feature_with_gaps_matches_pandas():
+    frame = _frame_with_gaps()
+    first = frame.ewm(span=5, min_periods=3, adjust=False).mean()
+    second = first.ewm(span=5, min_periods=3, adjust=False).mean()
+    third = second.ewm(span=5, min_periods=3, adjust=False).mean()
+
+    feature = TripleExponentialMovingFeature(span=5, min_periods=3)
+    split = pd.concat(
+        [
+            feature.fit(frame.iloc[:22]),
+            feature.fit(frame.iloc[22:], first_fit=False),
+        ]
+    )
+
+    pd.testing.assert_frame_equal(split, 3 * first - 3 * second + third)
+
+
+def _random_walk(n_rows=40, seed=2):
+    return pd.DataFrame(
+        np.random.RandomState(seed).randn(n_rows, 2).cumsum(axis=0) + 50,
+        columns=["a", "b"],
+    )
+
+
+def _split_fit(feature, frame, splits):
+    return pd.concat(
+        [
+            feature.fit(frame.iloc[_start:_end], first_fit=(_start == 0))
+            for _start, _end in zip(splits[:-1], splits[1:])
+        ]
+    )
+
+
+def _kaufman_efficiency(x):
+    _down = np.abs(np.diff(x)).sum()
+    return 0 if _down == 0 else np.abs(x[-1] - x[0]) / _down
+
+
+def _kaufman_adaptive_reference(frame, lookback_period, min_periods, fast, slow):
+    """row by row recursion of the original implementation"""
+    efficiency = frame.rolling(lookback_period, min_periods=min_periods).apply(
+        _kaufman_efficiency, raw=True
+    )
+    smoothing = (
+        efficiency * (2 / (fast + 1) - 2 / (slow + 1)) + 2 / (slow + 1)
+    ).to_numpy() ** 2
+    first = lookback_period - 2 if min_periods is None else max(min_periods - 2, 0)
+
+    kama = np.zeros(frame.shape)
+    previous = np.zeros(frame.shape[1])
+    for row in range(first + 1, len(frame)):
+        previous = previous + smoothing[row] * (frame.to_numpy()[row] - previous)
+        kama[row] = previous
+    return pd.DataFrame(kama, index=frame.index, columns=frame.columns)
+
+
+@pytest.mark.parametrize("lookback_period, min_periods", [(4, None), (5, 3), (4, 1)])
+def test_kaufman_adaptive_moving_average_matches_recursion(
+    lookback_period, min_periods
+):
+    frame = _random_walk()
+    expected = _kaufman_adaptive_reference(frame, lookback_period, min_periods, 2, 5)
+
+    feature = KaufmanAdaptiveMovingAverage(
+        kaufman_efficiency_lookback_period=lookback_period,
+        kaufman_efficiency_min_periods=min_periods,
+    )
+
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 40]), expected)
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 12, 13, 40]), expected)
+
+
+def _fractal_adaptive_reference(frame, lookback_period, min_periods):
+    """row by row recursion of the original implementation"""
+    half = int(lookback_period / 2)
+    first = frame.rolling(half, min_periods=min_periods).apply(
+        lambda x: (x.max() - x.min()) / half, raw=True
+    )
+    second = frame.rolling(lookback_period, min_periods=min_periods).apply(
+        lambda x: (x[:half].max() - x[:half].min()) / half, raw=True
+    )
+    third = frame.rolling(lookback_period, min_periods=min_periods).apply(
+        lambda x: (x.max() - x.min()) / lookback_period, raw=True
+    )
+    with np.errstate(divide="ignore"):
+        dimension = (np.log(second + first) - np.log(third)) / np.log(2)
+    alpha = np.exp(-4.6 * (dimension - 1)).fillna(0).clip(lower=0.01)
+    fast = lookback_period / 2
+    n = (lookback_period - fast) * ((2 - alpha) / alpha - 1) / (lookback_period - 1)
+    alpha = (2 / (n + fast + 1)).to_numpy()
+
+    fama = np.zeros(frame.shape)
+    previous = np.zeros(frame.shape[1])
+    for row in range(len(frame)):
+        previous = previous * (1 - alpha[row]) + frame.to_numpy()[row] * alpha[row]
+        fama[row] = previous
+    return pd.DataFrame(fama, index=frame.index, columns=frame.columns)
+
+
+@pytest.mark.parametrize("lookback_period, min_periods", [(8, 1), (8, 3), (9, 1)])
+def test_fractal_adaptive_moving_average_matches_recursion(
+    lookback_period, min_periods
+):
+    frame = _random_walk()
+    expected = _fractal_adaptive_reference(frame, lookback_period, min_periods)
+
+    feature = FractalAdaptiveMovingAverage(
+        lookback_period=lookback_period, min_periods=min_periods
+    )
+
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 40]), expected)
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 12, 13, 40]), expected)
+
+
+def _smoothed_reference(frame, lookback_period):
+    """row by row recursion of the original implementation"""
+    values = frame.to_numpy()
+    sma = np.zeros(frame.shape)
+    sma[lookback_period - 1] = values[:lookback_period].sum(axis=0) / lookback_period
+    for row in range(lookback_period, len(frame)):
+        sma[row] = (
+            sma[row - 1] * (lookback_period - 1) + values[row]
+        ) / lookback_period
+    return pd.DataFrame(sma, index=frame.index, columns=frame.columns)
+
+
+@pytest.mark.parametrize("lookback_period", [1, 4, 7])
+def test_smoothed_moving_average_matches_recursion(lookback_period):
+    frame = _random_walk()
+    expected = _smoothed_reference(frame, lookback_period)
+
+    feature = SmoothedMovingAverage(lookback_period=lookback_period)
+
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 40]), expected)
+    pd.testing.assert_frame_equal(_split_fit(feature, frame, [0, 12, 13, 40]), expected)
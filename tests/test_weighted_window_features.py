@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from NitroFE import weighted_window_features
+from NitroFE.time_based_features.weighted_window_features.weighted_window_kernels import (
+    _accepts_axis,
+)
+from NitroFE.time_based_features.weighted_window_features.weighted_windows import (
+    _hamming_window,
+)
+
+
+@pytest.mark.parametrize("operation", [pd.Series.std, pd.Series.median, pd.Series.skew])
+def test_pandas_method_operation_matches_rolling_agg(operation):
+    series = pd.Series(np.random.RandomState(0).rand(30))
+    expected = series.rolling(window=5, min_periods=1).agg(
+        lambda x: operation(_hamming_window(data=x, window_size=5, symmetric=False))
+    )
+
+    result = weighted_window_features().caluclate_hamming_feature(
+        series, window=5, operation=operation
+    )
+
+    assert not _accepts_axis(operation, ())
+    pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("operation", [np.mean, np.sum, np.std])
+def test_missing_values_match_rolling_agg(operation):
+    frame = pd.DataFrame(np.random.RandomState(1).rand(30, 2), columns=["a", "b"])
+    frame.iloc[[3, 4, 17], 0] = np.nan
+    expected = frame.rolling(window=5, min_periods=2).agg(
+        lambda x: operation(_hamming_window(data=x, window_size=5, symmetric=False))
+    )
+
+    features = weighted_window_features()
+    result = pd.concat(
+        [
+            features.caluclate_hamming_feature(
+                frame.iloc[:10], window=5, min_periods=2, operation=operation
+            ),
+            features.caluclate_hamming_feature(
+                frame.iloc[10:],
+                first_fit=False,
+                window=5,
+                min_periods=2,
+                operation=operation,
+            ),
+        ]
+    )
+
+    pd.testing.assert_frame_equal(result, expected)